@@ -10,7 +10,9 @@
 """
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -22,9 +24,33 @@ except ImportError:
     print("请先安装依赖: pip install akshare pandas numpy")
     sys.exit(1)
 
+from cache_manager import cache_get, cache_set, cache_get_df, cache_set_df
 from calc_technical import calc_all_indicators, analyze_signals
 
 
+# 打分分段表: np.searchsorted 按边界取档替代 if/elif 阶梯，
+# 分值与信号文案按档位索引。`<` 型阶梯用 side='right'，`>` 型用 side='left'，
+# 与原条件的边界归属一致; 混合 `<`/`>` 的阶梯 (PB、净利润) 对严格
+# 不等式一侧的边界用 np.nextafter 微移，恰好等于边界的值保持原中档归属
+PE_EDGES = np.array([15.0, 25.0, 40.0])
+PE_SCORES = (20, 10, 0, -10)
+PE_SIGNALS = ('🟢 PE<15，估值较低', '🟡 PE适中 (15-25)', '🟡 PE偏高 (25-40)', '🔴 PE>40，估值较高')
+
+PB_EDGES = np.array([2.0, np.nextafter(5.0, np.inf)])  # pb == 5 仍属中档
+PB_SCORES = (10, 0, -5)
+PB_SIGNALS = ('🟢 PB<2，价值凸显', None, '🔴 PB>5，溢价较高')
+
+GROWTH_EDGES = np.array([0.0, 15.0, 30.0])
+REV_SCORES = (-10, 5, 15, 25)
+REV_SIGNALS = ('🔴 营收负增长{g:.1f}%', '🟡 营收增速{g:.1f}%',
+               '🟢 营收增速{g:.1f}%，稳健增长', '🟢 营收增速{g:.1f}%，高增长')
+PROFIT_EDGES = np.array([np.nextafter(0.0, -np.inf), 15.0, 30.0])  # 增速恰为 0 仍属中档
+PROFIT_SCORES = (-15, 0, 15, 25)
+PROFIT_SIGNALS = ('🔴 净利润负增长{g:.1f}%', None,
+                  '🟢 净利润增速{g:.1f}%，稳健', '🟢 净利润增速{g:.1f}%，高增长')
+
+
+@lru_cache(maxsize=4096)
 def get_code_with_prefix(code: str) -> str:
     if code.startswith('6'):
         return f"SH{code}"
@@ -33,6 +59,7 @@ def get_code_with_prefix(code: str) -> str:
     return f"SZ{code}"
 
 
+@lru_cache(maxsize=4096)
 def get_market(code: str) -> str:
     return 'sh' if code.startswith('6') else 'sz'
 
@@ -40,55 +67,107 @@ def get_market(code: str) -> str:
 class InvestmentAnalyzer:
     """投资分析器"""
     
-    def __init__(self, code: str):
+    def __init__(self, code: str, spot_df: pd.DataFrame = None):
+        """
+        Args:
+            code: 股票代码
+            spot_df: 可选，以 '代码' 为索引的全市场快照。
+                     批量分析时由调用方拉取一次后注入，免去每只股票重复下载
+        """
         self.code = code
         self.code_with_prefix = get_code_with_prefix(code)
         self.market = get_market(code)
+        self.spot_df = spot_df
         self.scores = {}
         self.analysis = {}
         self.data = {}
     
     def fetch_data(self):
-        """获取所有需要的数据"""
-        # 基本信息
-        try:
-            self.data['info'] = ak.stock_individual_info_em(symbol=self.code)
-        except:
-            pass
-        
-        # 实时行情
-        try:
-            spot = ak.stock_zh_a_spot_em()
-            self.data['spot'] = spot[spot['代码'] == self.code].iloc[0] if len(spot[spot['代码'] == self.code]) > 0 else None
-        except:
-            pass
-        
-        # 历史K线
-        try:
-            end = datetime.now().strftime('%Y%m%d')
-            start = (datetime.now() - timedelta(days=365)).strftime('%Y%m%d')
-            self.data['kline'] = ak.stock_zh_a_hist(symbol=self.code, period='daily', start_date=start, end_date=end, adjust='qfq')
-        except:
-            pass
-        
+        """获取所有需要的数据 (缓存优先，未命中的网络请求并发执行)"""
+
+        # 基本信息: item/value 帧的 value 列混杂字符串与数值，
+        # Parquet (Arrow) 写不了这种异构列，与估值数据一样走 JSON 缓存
+        def _fetch_info():
+            records = cache_get('info', self.code)
+            if records:
+                return pd.DataFrame(records)
+            df = ak.stock_individual_info_em(symbol=self.code)
+            if df is not None:
+                cache_set('info', df.to_dict('records'), self.code)
+            return df
+
+        # 实时行情: 注入的索引快照 O(1) 查行，否则退回全市场拉取
+        def _fetch_spot():
+            if self.spot_df is not None:
+                return self.spot_df.loc[self.code] if self.code in self.spot_df.index else None
+            spot = cache_get_df('realtime', 'market_spot')
+            if spot is None:
+                spot = ak.stock_zh_a_spot_em()
+                if spot is not None:
+                    cache_set_df('realtime', spot, 'market_spot')
+            # 布尔过滤只做一次，避免 len(...) 与 .iloc[0] 各扫全表一遍
+            hits = spot[spot['代码'] == self.code]
+            return hits.iloc[0] if len(hits) > 0 else None
+
+        # 历史K线 (缓存键与 get_history_kline 保持一致，两条路径互相命中)
+        def _fetch_kline():
+            now = datetime.now()
+            end = now.strftime('%Y%m%d')
+            start = (now - timedelta(days=365)).strftime('%Y%m%d')
+            key = f"{self.code}_daily_{start}_{end}_qfq"
+            df = cache_get_df('daily_kline', key)
+            if df is None:
+                df = ak.stock_zh_a_hist(symbol=self.code, period='daily', start_date=start, end_date=end, adjust='qfq')
+                if df is not None:
+                    cache_set_df('daily_kline', df, key)
+            return df
+
         # 雪球估值
-        try:
-            xq = ak.stock_individual_spot_xq(symbol=self.code_with_prefix)
-            self.data['valuation'] = dict(zip(xq['item'], xq['value'])) if xq is not None else {}
-        except:
-            pass
-        
-        # 资金流向
-        try:
-            self.data['fund_flow'] = ak.stock_individual_fund_flow(stock=self.code, market=self.market)
-        except:
-            pass
-        
+        def _fetch_valuation():
+            data = cache_get('valuation', self.code_with_prefix)
+            if data is None:
+                xq = ak.stock_individual_spot_xq(symbol=self.code_with_prefix)
+                data = dict(zip(xq['item'], xq['value'])) if xq is not None else {}
+                cache_set('valuation', data, self.code_with_prefix)
+            return data
+
+        # 资金流向 (缓存键与 get_fund_flow 保持一致)
+        def _fetch_fund_flow():
+            key = f"{self.code}_{self.market}"
+            df = cache_get_df('fund_flow', key)
+            if df is None:
+                df = ak.stock_individual_fund_flow(stock=self.code, market=self.market)
+                if df is not None:
+                    cache_set_df('fund_flow', df, key)
+            return df
+
         # 财务数据
-        try:
-            self.data['financial'] = ak.stock_financial_abstract_ths(symbol=self.code, indicator="按报告期")
-        except:
-            pass
+        def _fetch_financial():
+            df = cache_get_df('financial', self.code)
+            if df is None:
+                df = ak.stock_financial_abstract_ths(symbol=self.code, indicator="按报告期")
+                if df is not None:
+                    cache_set_df('financial', df, self.code)
+            return df
+
+        tasks = {
+            'info': _fetch_info,
+            'spot': _fetch_spot,
+            'kline': _fetch_kline,
+            'valuation': _fetch_valuation,
+            'fund_flow': _fetch_fund_flow,
+            'financial': _fetch_financial,
+        }
+
+        # 六路数据互相独立且以网络 IO 为主: 并发执行后总耗时
+        # 由六次请求之和降为最慢一次; 单个失败不影响其余维度
+        with ThreadPoolExecutor(max_workers=len(tasks)) as ex:
+            futures = {ex.submit(fn): key for key, fn in tasks.items()}
+            for future in as_completed(futures):
+                try:
+                    self.data[futures[future]] = future.result()
+                except Exception:
+                    pass
     
     def analyze_valuation(self) -> dict:
         """估值分析"""
@@ -102,25 +181,15 @@ class InvestmentAnalyzer:
             pb = spot.get('市净率', 0)
             
             if pe and pe > 0:
-                if pe < 15:
-                    result['score'] += 20
-                    result['signals'].append('🟢 PE<15，估值较低')
-                elif pe < 25:
-                    result['score'] += 10
-                    result['signals'].append('🟡 PE适中 (15-25)')
-                elif pe < 40:
-                    result['signals'].append('🟡 PE偏高 (25-40)')
-                else:
-                    result['score'] -= 10
-                    result['signals'].append('🔴 PE>40，估值较高')
+                idx = int(np.searchsorted(PE_EDGES, pe, side='right'))
+                result['score'] += PE_SCORES[idx]
+                result['signals'].append(PE_SIGNALS[idx])
             
             if pb and pb > 0:
-                if pb < 2:
-                    result['score'] += 10
-                    result['signals'].append('🟢 PB<2，价值凸显')
-                elif pb > 5:
-                    result['score'] -= 5
-                    result['signals'].append('🔴 PB>5，溢价较高')
+                idx = int(np.searchsorted(PB_EDGES, pb, side='right'))
+                result['score'] += PB_SCORES[idx]
+                if PB_SIGNALS[idx]:
+                    result['signals'].append(PB_SIGNALS[idx])
         
         # 股息率
         dv = val.get('股息率(TTM)')
@@ -144,18 +213,9 @@ class InvestmentAnalyzer:
             if rev_growth and str(rev_growth) not in ['False', 'nan']:
                 try:
                     growth = float(str(rev_growth).replace('%', ''))
-                    if growth > 30:
-                        result['score'] += 25
-                        result['signals'].append(f'🟢 营收增速{growth:.1f}%，高增长')
-                    elif growth > 15:
-                        result['score'] += 15
-                        result['signals'].append(f'🟢 营收增速{growth:.1f}%，稳健增长')
-                    elif growth > 0:
-                        result['score'] += 5
-                        result['signals'].append(f'🟡 营收增速{growth:.1f}%')
-                    else:
-                        result['score'] -= 10
-                        result['signals'].append(f'🔴 营收负增长{growth:.1f}%')
+                    idx = int(np.searchsorted(GROWTH_EDGES, growth, side='left'))
+                    result['score'] += REV_SCORES[idx]
+                    result['signals'].append(REV_SIGNALS[idx].format(g=growth))
                 except:
                     pass
             
@@ -164,15 +224,10 @@ class InvestmentAnalyzer:
             if profit_growth and str(profit_growth) not in ['False', 'nan']:
                 try:
                     growth = float(str(profit_growth).replace('%', ''))
-                    if growth > 30:
-                        result['score'] += 25
-                        result['signals'].append(f'🟢 净利润增速{growth:.1f}%，高增长')
-                    elif growth > 15:
-                        result['score'] += 15
-                        result['signals'].append(f'🟢 净利润增速{growth:.1f}%，稳健')
-                    elif growth < 0:
-                        result['score'] -= 15
-                        result['signals'].append(f'🔴 净利润负增长{growth:.1f}%')
+                    idx = int(np.searchsorted(PROFIT_EDGES, growth, side='left'))
+                    result['score'] += PROFIT_SCORES[idx]
+                    if PROFIT_SIGNALS[idx]:
+                        result['signals'].append(PROFIT_SIGNALS[idx].format(g=growth))
                 except:
                     pass
         
@@ -185,10 +240,11 @@ class InvestmentAnalyzer:
         
         flow = self.data.get('fund_flow')
         if flow is not None and len(flow) > 0 and '主力净流入-净额' in flow.columns:
-            recent = flow.tail(10)
-            total = recent['主力净流入-净额'].sum()
-            latest = recent['主力净流入-净额'].iloc[-1]
-            recent_3 = recent['主力净流入-净额'].tail(3).sum()
+            # 取出底层数组后切片聚合，免去 tail/iloc 逐次构造 Series
+            arr = flow['主力净流入-净额'].to_numpy(np.float64)[-10:]
+            total = arr.sum()
+            latest = arr[-1]
+            recent_3 = arr[-3:].sum()
             
             # 整体趋势
             if total > 0:
@@ -215,6 +271,12 @@ class InvestmentAnalyzer:
         
         kline = self.data.get('kline')
         if kline is not None and len(kline) > 60:
+            # 数值列先统一成 float64: 计算核内的 to_numpy(np.float64)
+            # 零拷贝取列，numba 核 (cache=True) 只在首次调用时编译
+            kline = kline.copy()
+            for col in ('收盘', '最高', '最低', '成交量'):
+                if col in kline.columns:
+                    kline[col] = kline[col].astype(np.float64)
             kline = calc_all_indicators(kline)
             signals = analyze_signals(kline)
             
@@ -16,13 +16,51 @@
 import sqlite3
 import json
 import os
+import time
 import hashlib
+import threading
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
 # 默认缓存目录
 CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.cache')
 DB_PATH = os.path.join(CACHE_DIR, 'akshare_cache.db')
+# DataFrame 缓存目录 (Parquet 文件，按列存储保留 dtype)
+DF_CACHE_DIR = os.path.join(CACHE_DIR, 'df')
+
+# pandas/pyarrow 为 DataFrame 缓存所需; 缺失时退化为 JSON 记录缓存
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+try:
+    import pyarrow  # noqa: F401  (to_parquet 引擎)
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# xxhash 为可选加速: xxh3 比 blake2b 快一个量级; 两者都非加密用途
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+# orjson 为可选加速: 直接产出 bytes 入 BLOB 列; 缺失时退化为标准库 json
+try:
+    import orjson
+
+    def _dumps(value) -> bytes:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(value) -> bytes:
+        return json.dumps(value, default=str, ensure_ascii=False).encode()
+
+    _loads = json.loads  # 同时接受 str/bytes，兼容旧表中的 TEXT 行
 
 # 缓存过期时间配置（秒）
 CACHE_EXPIRE = {
@@ -32,6 +70,7 @@ CACHE_EXPIRE = {
     'shareholders': 86400 * 30,  # 股东数据: 30天
     'dividend': 86400 * 30,   # 分红数据: 30天
     'valuation': 3600,        # 估值数据: 1小时
+    'info': 86400,            # 个股基本信息: 1天
     'fund_flow': 3600,        # 资金流向: 1小时
     'board': 86400,           # 板块数据: 1天
 }
@@ -49,6 +88,20 @@ class CacheManager:
         """
         self.db_path = db_path or DB_PATH
         self._ensure_cache_dir()
+        # 常驻连接: 免去每次操作的连接建立/关闭开销;
+        # WAL 模式下读不阻塞写，配合调度器的并发访问
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        for pragma in ('journal_mode=WAL', 'synchronous=NORMAL',
+                       'temp_store=MEMORY', 'mmap_size=268435456'):
+            self._conn.execute(f'PRAGMA {pragma}')
+        # 进程内一级缓存: {key: (过期时间戳, 已反序列化的值)}，
+        # 同一次运行内的重复读命中 dict，不再走 SQLite + JSON 解析
+        self._mem = {}
+        self._mem_max = 1024
+        # 写入计数: 每 _clean_every 次 set 顺带清一次过期行，保持表精简
+        self._set_count = 0
+        self._clean_every = 1000
         self._init_db()
     
     def _ensure_cache_dir(self):
@@ -59,16 +112,18 @@ class CacheManager:
     
     def _init_db(self):
         """初始化数据库表"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS cache (
-                    key TEXT PRIMARY KEY,
-                    value TEXT,
-                    expire_at TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            conn.commit()
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value BLOB,
+                expire_at TIMESTAMP,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        # clear_expired / get_stats 按 expire_at 过滤，建索引避免全表扫描
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_cache_expire ON cache(expire_at)'
+        )
     
     def _generate_key(self, category: str, *args, **kwargs) -> str:
         """
@@ -84,10 +139,19 @@ class CacheManager:
         """
         key_parts = [category] + list(args)
         if kwargs:
-            key_parts.append(json.dumps(kwargs, sort_keys=True))
+            # 直接拼接排序后的键值对，比 json.dumps 规范化轻得多
+            key_parts.append(';'.join(f"{k}={v}" for k, v in sorted(kwargs.items())))
         raw_key = ':'.join(str(p) for p in key_parts)
-        return hashlib.md5(raw_key.encode()).hexdigest()
+        if HAS_XXHASH:
+            return xxhash.xxh3_128_hexdigest(raw_key)
+        return hashlib.blake2b(raw_key.encode(), digest_size=16).hexdigest()
     
+    def _mem_store(self, key: str, expire_ts: float, value: Any):
+        """写入进程内缓存，满员时按插入序淘汰最旧项"""
+        if len(self._mem) >= self._mem_max:
+            self._mem.pop(next(iter(self._mem)))
+        self._mem[key] = (expire_ts, value)
+
     def set(self, key: str, value: Any, expire_seconds: int = 3600) -> bool:
         """
         设置缓存
@@ -102,14 +166,17 @@ class CacheManager:
         """
         try:
             expire_at = datetime.now() + timedelta(seconds=expire_seconds)
-            value_json = json.dumps(value, default=str, ensure_ascii=False)
-            
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute('''
+            value_json = _dumps(value)
+
+            with self._lock:
+                self._conn.execute('''
                     INSERT OR REPLACE INTO cache (key, value, expire_at)
                     VALUES (?, ?, ?)
                 ''', (key, value_json, expire_at))
-                conn.commit()
+            self._mem_store(key, expire_at.timestamp(), value)
+            self._set_count += 1
+            if self._set_count % self._clean_every == 0:
+                self.clear_expired()
             return True
         except Exception as e:
             print(f"缓存写入失败: {e}")
@@ -126,34 +193,86 @@ class CacheManager:
             缓存值，如果不存在或已过期返回 None
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute('''
+            hit = self._mem.get(key)
+            if hit is not None:
+                expire_ts, value = hit
+                if time.time() < expire_ts:
+                    return value
+                self._mem.pop(key, None)
+
+            with self._lock:
+                row = self._conn.execute('''
                     SELECT value, expire_at FROM cache WHERE key = ?
-                ''', (key,))
-                row = cursor.fetchone()
-                
-                if row is None:
-                    return None
-                
-                value_json, expire_at = row
-                expire_time = datetime.fromisoformat(expire_at)
-                
-                if datetime.now() > expire_time:
-                    # 已过期，删除并返回 None
-                    self.delete(key)
-                    return None
-                
-                return json.loads(value_json)
+                ''', (key,)).fetchone()
+
+            if row is None:
+                return None
+
+            value_json, expire_at = row
+            expire_time = datetime.fromisoformat(expire_at)
+
+            if datetime.now() > expire_time:
+                # 已过期，删除并返回 None
+                self.delete(key)
+                return None
+
+            value = _loads(value_json)
+            self._mem_store(key, expire_time.timestamp(), value)
+            return value
         except Exception as e:
             print(f"缓存读取失败: {e}")
             return None
     
+    def get_many(self, keys: list) -> dict:
+        """
+        批量获取缓存
+
+        一条 IN 查询取回所有未命中一级缓存的键，过期项在 Python 侧过滤；
+        命中的值顺带写入进程内缓存，后续单键 get 直接走 dict。
+
+        Args:
+            keys: 缓存键列表
+
+        Returns:
+            {key: value}，仅包含存在且未过期的键
+        """
+        result = {}
+        missing = []
+        now = time.time()
+        for key in keys:
+            hit = self._mem.get(key)
+            if hit is not None and now < hit[0]:
+                result[key] = hit[1]
+            else:
+                missing.append(key)
+
+        if not missing:
+            return result
+
+        try:
+            placeholders = ','.join('?' * len(missing))
+            with self._lock:
+                rows = self._conn.execute(f'''
+                    SELECT key, value, expire_at FROM cache WHERE key IN ({placeholders})
+                ''', missing).fetchall()
+
+            for key, value_json, expire_at in rows:
+                expire_time = datetime.fromisoformat(expire_at)
+                if datetime.now() > expire_time:
+                    continue
+                value = _loads(value_json)
+                self._mem_store(key, expire_time.timestamp(), value)
+                result[key] = value
+        except Exception as e:
+            print(f"缓存读取失败: {e}")
+        return result
+
     def delete(self, key: str) -> bool:
         """删除缓存"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute('DELETE FROM cache WHERE key = ?', (key,))
-                conn.commit()
+            self._mem.pop(key, None)
+            with self._lock:
+                self._conn.execute('DELETE FROM cache WHERE key = ?', (key,))
             return True
         except Exception:
             return False
@@ -161,21 +280,22 @@ class CacheManager:
     def clear_expired(self) -> int:
         """清理所有过期缓存，返回清理数量"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute('''
+            now = time.time()
+            self._mem = {k: v for k, v in self._mem.items() if v[0] > now}
+            with self._lock:
+                cursor = self._conn.execute('''
                     DELETE FROM cache WHERE expire_at < ?
                 ''', (datetime.now(),))
-                conn.commit()
-                return cursor.rowcount
+            return cursor.rowcount
         except Exception:
             return 0
     
     def clear_all(self) -> bool:
         """清空所有缓存"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute('DELETE FROM cache')
-                conn.commit()
+            self._mem.clear()
+            with self._lock:
+                self._conn.execute('DELETE FROM cache')
             return True
         except Exception:
             return False
@@ -183,16 +303,16 @@ class CacheManager:
     def get_stats(self) -> dict:
         """获取缓存统计信息"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._lock:
                 # 总数
-                total = conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+                total = self._conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
                 # 已过期数
-                expired = conn.execute('''
+                expired = self._conn.execute('''
                     SELECT COUNT(*) FROM cache WHERE expire_at < ?
                 ''', (datetime.now(),)).fetchone()[0]
                 # 数据库大小
                 db_size = os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0
-                
+
                 return {
                     'total': total,
                     'expired': expired,
@@ -230,6 +350,57 @@ def cache_set(category: str, value: Any, *args, expire_seconds: int = None, **kw
     return cache.set(key, value, expire_seconds)
 
 
+def _df_cache_path(category: str, *args, **kwargs) -> str:
+    """DataFrame 缓存文件路径"""
+    key = get_cache()._generate_key(category, *args, **kwargs)
+    return os.path.join(DF_CACHE_DIR, f"{category}_{key}.parquet")
+
+
+def cache_get_df(category: str, *args, max_age_seconds: float = None, **kwargs):
+    """
+    读取 DataFrame 缓存 (Parquet)
+
+    Args:
+        category: 数据类别
+        max_age_seconds: 最大缓存龄（秒），默认取 CACHE_EXPIRE 配置
+
+    Returns:
+        DataFrame，不存在或已过期返回 None
+    """
+    if not (HAS_PANDAS and HAS_PYARROW):
+        data = cache_get(category, *args, **kwargs)
+        return pd.DataFrame(data) if (HAS_PANDAS and data) else None
+
+    path = _df_cache_path(category, *args, **kwargs)
+    if not os.path.exists(path):
+        return None
+
+    if max_age_seconds is None:
+        max_age_seconds = CACHE_EXPIRE.get(category, 3600)
+    if time.time() - os.path.getmtime(path) > max_age_seconds:
+        return None
+
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        print(f"缓存读取失败: {e}")
+        return None
+
+
+def cache_set_df(category: str, df, *args, **kwargs) -> bool:
+    """写入 DataFrame 缓存 (Parquet)，保留列 dtype、不经过逐行 dict 转换"""
+    if not (HAS_PANDAS and HAS_PYARROW):
+        return cache_set(category, df.to_dict('records'), *args, **kwargs)
+
+    try:
+        os.makedirs(DF_CACHE_DIR, exist_ok=True)
+        df.to_parquet(_df_cache_path(category, *args, **kwargs), index=False)
+        return True
+    except Exception as e:
+        print(f"缓存写入失败: {e}")
+        return False
+
+
 if __name__ == '__main__':
     # 测试缓存
     cache = CacheManager()
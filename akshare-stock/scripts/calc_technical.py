@@ -17,7 +17,6 @@ import argparse
 import sys
 from datetime import datetime, timedelta
 import warnings
-warnings.filterwarnings('ignore')
 
 try:
     import akshare as ak
@@ -27,95 +26,236 @@ except ImportError:
     print("请先安装依赖: pip install akshare pandas numpy")
     sys.exit(1)
 
+# numba 为可选依赖: 存在时将计算核编译为机器码，缺失时退化为纯 Python 循环
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrapper(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrapper
+
 
-def calc_ma(df: pd.DataFrame, periods: list = [5, 10, 20, 60]) -> pd.DataFrame:
+def _rolling_mean_cs(arr: np.ndarray, period: int) -> np.ndarray:
+    """基于前缀和的滚动均值，前 period-1 位为 NaN"""
+    cs = np.concatenate(([0.0], np.cumsum(arr)))
+    out = np.full(len(arr), np.nan)
+    if len(arr) >= period:
+        out[period - 1:] = (cs[period:] - cs[:-period]) / period
+    return out
+
+
+def calc_ma(df: pd.DataFrame, periods: list = [5, 10, 20, 60]) -> dict:
     """
     计算均线
-    
+
     Args:
         df: K线数据，需包含 '收盘' 列
         periods: 均线周期列表
-    
+
     Returns:
-        添加均线列的 DataFrame
+        {列名: ndarray} 均线列字典
     """
+    close = df['收盘'].to_numpy(np.float64)
+    n = len(close)
+
+    # 一次前缀和，所有周期的均线都由区间差分得到，避免多次 rolling 扫描
+    cs = np.empty(n + 1)
+    cs[0] = 0.0
+    np.cumsum(close, out=cs[1:])
+
+    cols = {}
     for period in periods:
-        df[f'MA{period}'] = df['收盘'].rolling(window=period).mean()
-    return df
+        ma = np.full(n, np.nan)
+        if n >= period:
+            ma[period - 1:] = (cs[period:] - cs[:-period]) / period
+        cols[f'MA{period}'] = ma
+    return cols
 
 
-def calc_macd(df: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int = 9) -> pd.DataFrame:
+@njit(cache=True, fastmath=True)
+def _ema(x, alpha, out):
+    """指数移动平均核: V_i = alpha*x_i + (1-alpha)*V_{i-1}，MACD/信号线通用"""
+    if x.shape[0] == 0:
+        return
+    out[0] = x[0]
+    for i in range(1, x.shape[0]):
+        out[i] = alpha * x[i] + (1.0 - alpha) * out[i - 1]
+
+
+def calc_macd(df: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int = 9) -> dict:
     """
-    计算 MACD
-    
+    计算 MACD (共用 _ema 核，避免逐次构造 pandas EWM 对象)
+
     Args:
         df: K线数据
         fast: 快线周期
         slow: 慢线周期
         signal: 信号线周期
-    
+
     Returns:
-        添加 MACD 指标的 DataFrame
+        {列名: ndarray} MACD 指标列字典
     """
-    exp1 = df['收盘'].ewm(span=fast, adjust=False).mean()
-    exp2 = df['收盘'].ewm(span=slow, adjust=False).mean()
-    
-    df['DIF'] = exp1 - exp2
-    df['DEA'] = df['DIF'].ewm(span=signal, adjust=False).mean()
-    df['MACD'] = 2 * (df['DIF'] - df['DEA'])
-    
-    return df
+    close = df['收盘'].to_numpy(np.float64)
+
+    e1 = np.empty_like(close)
+    e2 = np.empty_like(close)
+    _ema(close, 2.0 / (fast + 1), e1)
+    _ema(close, 2.0 / (slow + 1), e2)
+
+    dif = e1 - e2
+    dea = np.empty_like(close)
+    _ema(dif, 2.0 / (signal + 1), dea)
+
+    return {'DIF': dif, 'DEA': dea, 'MACD': 2 * (dif - dea)}
 
 
-def calc_rsi(df: pd.DataFrame, periods: list = [6, 12, 24]) -> pd.DataFrame:
+@njit(cache=True, fastmath=True)
+def _rsi_wilder(close, period, out):
+    """单遍 Wilder 平滑 RSI 核 (alpha = 1/period)，结果写入 out"""
+    n = close.shape[0]
+    if n == 0:
+        return
+    avg_g = 0.0
+    avg_l = 0.0
+    out[0] = np.nan
+    for i in range(1, n):
+        d = close[i] - close[i - 1]
+        g = d if d > 0 else 0.0
+        l = -d if d < 0 else 0.0
+        avg_g = (avg_g * (period - 1) + g) / period
+        avg_l = (avg_l * (period - 1) + l) / period
+        if avg_l == 0.0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_g / avg_l)
+
+
+def calc_rsi(df: pd.DataFrame, periods: list = [6, 12, 24]) -> dict:
     """
-    计算 RSI
-    
+    计算 RSI (Wilder 平滑，单遍扫描收盘价)
+
     Args:
         df: K线数据
         periods: RSI 周期列表
-    
+
     Returns:
-        添加 RSI 指标的 DataFrame
+        {列名: ndarray} RSI 指标列字典
     """
-    delta = df['收盘'].diff()
-    
+    close = df['收盘'].to_numpy(np.float64)
+
+    # 空帧直接给出空列，向量化回退路径的 d[0]/rsi[0] 写入不再越界
+    if close.size == 0:
+        return {f'RSI{period}': np.empty(0) for period in periods}
+
+    cols = {}
+    if HAS_NUMBA:
+        for period in periods:
+            out = np.empty(len(close))
+            _rsi_wilder(close, period, out)
+            cols[f'RSI{period}'] = out
+        return cols
+
+    # 无 numba 时的向量化路径: np.maximum 单遍 ufunc 取涨/跌幅，
+    # 替代 where 的掩码+输出两次分配; Wilder 平滑即 ewm(alpha=1/period)
+    d = np.empty_like(close)
+    d[0] = 0.0
+    d[1:] = close[1:] - close[:-1]
+    gain = np.maximum(d, 0.0)
+    loss = np.maximum(-d, 0.0)
+
     for period in periods:
-        gain = delta.where(delta > 0, 0).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        
-        rs = gain / loss
-        df[f'RSI{period}'] = 100 - (100 / (1 + rs))
-    
-    return df
+        alpha = 1.0 / period
+        avg_g = pd.Series(gain).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+        avg_l = pd.Series(loss).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100.0 - 100.0 / (1.0 + avg_g / avg_l)
+        rsi = np.where(avg_l == 0.0, 100.0, rsi)
+        rsi[0] = np.nan
+        cols[f'RSI{period}'] = rsi
+
+    return cols
 
 
-def calc_kdj(df: pd.DataFrame, n: int = 9, m1: int = 3, m2: int = 3) -> pd.DataFrame:
+@njit(cache=True)
+def _kdj(high, low, close, n, m1, m2, out_k, out_d, out_j):
+    """单遍 KDJ 核: 单调队列维护窗口最高/最低，同一循环内折叠 RSV 与两级 EMA"""
+    size = close.shape[0]
+    qmax = np.empty(size, np.int64)
+    qmin = np.empty(size, np.int64)
+    hmax, tmax = 0, -1
+    hmin, tmin = 0, -1
+    k = 0.0
+    d = 0.0
+    started = False
+    for i in range(size):
+        while tmax >= hmax and high[qmax[tmax]] <= high[i]:
+            tmax -= 1
+        tmax += 1
+        qmax[tmax] = i
+        while tmin >= hmin and low[qmin[tmin]] >= low[i]:
+            tmin -= 1
+        tmin += 1
+        qmin[tmin] = i
+        if qmax[hmax] <= i - n:
+            hmax += 1
+        if qmin[hmin] <= i - n:
+            hmin += 1
+
+        if i < n - 1:
+            out_k[i] = np.nan
+            out_d[i] = np.nan
+            out_j[i] = np.nan
+            continue
+
+        maxv = high[qmax[hmax]]
+        minv = low[qmin[hmin]]
+        denom = maxv - minv
+        rsv = 50.0 if denom == 0.0 else (close[i] - minv) / denom * 100.0
+
+        if not started:
+            k = rsv
+            d = rsv
+            started = True
+        else:
+            k = k + (rsv - k) / m1
+            d = d + (k - d) / m2
+        out_k[i] = k
+        out_d[i] = d
+        out_j[i] = 3.0 * k - 2.0 * d
+
+
+def calc_kdj(df: pd.DataFrame, n: int = 9, m1: int = 3, m2: int = 3) -> dict:
     """
-    计算 KDJ
-    
+    计算 KDJ (单遍滚动极值 + EMA 融合)
+
     Args:
         df: K线数据
         n: RSV 周期
         m1: K 平滑周期
         m2: D 平滑周期
-    
+
     Returns:
-        添加 KDJ 指标的 DataFrame
+        {列名: ndarray} KDJ 指标列字典
     """
-    low_min = df['最低'].rolling(window=n).min()
-    high_max = df['最高'].rolling(window=n).max()
-    
-    rsv = (df['收盘'] - low_min) / (high_max - low_min) * 100
-    
-    df['K'] = rsv.ewm(alpha=1/m1, adjust=False).mean()
-    df['D'] = df['K'].ewm(alpha=1/m2, adjust=False).mean()
-    df['J'] = 3 * df['K'] - 2 * df['D']
-    
-    return df
+    high = df['最高'].to_numpy(np.float64)
+    low = df['最低'].to_numpy(np.float64)
+    close = df['收盘'].to_numpy(np.float64)
+
+    out_k = np.empty(len(close))
+    out_d = np.empty(len(close))
+    out_j = np.empty(len(close))
+    _kdj(high, low, close, n, float(m1), float(m2), out_k, out_d, out_j)
+
+    return {'K': out_k, 'D': out_d, 'J': out_j}
 
 
-def calc_boll(df: pd.DataFrame, period: int = 20, std_dev: int = 2) -> pd.DataFrame:
+def calc_boll(df: pd.DataFrame, period: int = 20, std_dev: int = 2) -> dict:
     """
     计算布林带
     
@@ -125,160 +265,197 @@ def calc_boll(df: pd.DataFrame, period: int = 20, std_dev: int = 2) -> pd.DataFr
         std_dev: 标准差倍数
     
     Returns:
-        添加布林带的 DataFrame
+        {列名: ndarray} 布林带指标列字典
     """
-    df['BOLL_MID'] = df['收盘'].rolling(window=period).mean()
-    std = df['收盘'].rolling(window=period).std()
-    
-    df['BOLL_UP'] = df['BOLL_MID'] + std_dev * std
-    df['BOLL_DOWN'] = df['BOLL_MID'] - std_dev * std
-    
-    return df
+    close = df['收盘'].to_numpy(np.float64)
+    n = len(close)
+
+    # 由 x 与 x*x 的前缀和一次性推出滚动均值和方差，替代两次 rolling 扫描
+    s1 = np.concatenate(([0.0], np.cumsum(close)))
+    s2 = np.concatenate(([0.0], np.cumsum(close * close)))
+
+    mid = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if n >= period:
+        mean = (s1[period:] - s1[:-period]) / period
+        var = (s2[period:] - s2[:-period]) / period - mean * mean
+        # 样本标准差 (ddof=1)，与 rolling().std() 一致；浮点误差可能产生微小负数
+        mid[period - 1:] = mean
+        std[period - 1:] = np.sqrt(np.maximum(var, 0.0) * period / (period - 1))
 
+    return {'BOLL_MID': mid, 'BOLL_UP': mid + std_dev * std, 'BOLL_DOWN': mid - std_dev * std}
 
-def calc_volume_ratio(df: pd.DataFrame, period: int = 5) -> pd.DataFrame:
+
+def calc_volume_ratio(df: pd.DataFrame, period: int = 5) -> dict:
     """计算量比"""
-    df['量比'] = df['成交量'] / df['成交量'].rolling(window=period).mean()
-    return df
+    vol = df['成交量'].to_numpy(np.float64)
+    return {'量比': vol / _rolling_mean_cs(vol, period)}
 
 
 def calc_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
-    """计算所有技术指标"""
-    df = calc_ma(df)
-    df = calc_macd(df)
-    df = calc_rsi(df)
-    df = calc_kdj(df)
-    df = calc_boll(df)
-    df = calc_volume_ratio(df)
-    return df
+    """计算所有技术指标，所有指标列经一次 assign 合并，避免逐列插入造成块碎片"""
+    cols = {}
+    cols.update(calc_ma(df))
+    cols.update(calc_macd(df))
+    cols.update(calc_rsi(df))
+    cols.update(calc_kdj(df))
+    cols.update(calc_boll(df))
+    cols.update(calc_volume_ratio(df))
+    return df.assign(**cols)
 
 
-def analyze_signals(df: pd.DataFrame) -> dict:
+# 信号标签表: classify_signals_vec 用 np.select 产出类别下标后查表
+MA_LABELS = ['🟢 金叉（MA5上穿MA20）', '🔴 死叉（MA5下穿MA20）', '🟢 多头排列', '🔴 空头排列', '⚪ 震荡']
+MACD_LABELS = ['🟢 金叉', '🔴 死叉', '🟢 多头', '🔴 空头']
+RSI_LABELS = ['🔴 超买 ({:.1f})', '🟢 超卖 ({:.1f})', '🟢 偏强 ({:.1f})', '🔴 偏弱 ({:.1f})']
+KDJ_LABELS = ['🟢 低位金叉', '🔴 高位死叉', '🔴 超买 (J={:.1f})', '🟢 超卖 (J={:.1f})', '⚪ 中性']
+BOLL_LABELS = ['🔴 突破上轨（注意回调）', '🟢 突破下轨（注意反弹）', '⚪ 通道内 (带宽{:.1f}%)']
+
+
+def _shift1(arr: np.ndarray) -> np.ndarray:
+    """后移一位，首元素复制自身（单行时 prev == latest，与原逻辑一致）"""
+    out = np.empty_like(arr)
+    out[0] = arr[0]
+    out[1:] = arr[:-1]
+    return out
+
+
+def classify_signals_vec(df: pd.DataFrame) -> dict:
     """
-    分析技术信号
-    
+    向量化技术信号分类
+
+    条件用布尔向量在整个 DataFrame 上一次性算出并经 np.select 归类，
+    单只股票只读末行结果；批量扫描多只股票时同一套数组天然复用。
+
     Returns:
         技术信号字典
     """
-    latest = df.iloc[-1]
-    prev = df.iloc[-2] if len(df) > 1 else latest
-    
+    cols = df.columns
     signals = {}
-    
+
+    close = df['收盘'].to_numpy(np.float64)
+
     # 均线分析
-    if 'MA5' in df.columns and 'MA20' in df.columns:
-        if latest['MA5'] > latest['MA20'] and prev['MA5'] <= prev['MA20']:
-            signals['均线'] = '🟢 金叉（MA5上穿MA20）'
-        elif latest['MA5'] < latest['MA20'] and prev['MA5'] >= prev['MA20']:
-            signals['均线'] = '🔴 死叉（MA5下穿MA20）'
-        elif latest['收盘'] > latest['MA5'] > latest['MA20']:
-            signals['均线'] = '🟢 多头排列'
-        elif latest['收盘'] < latest['MA5'] < latest['MA20']:
-            signals['均线'] = '🔴 空头排列'
-        else:
-            signals['均线'] = '⚪ 震荡'
-    
+    if 'MA5' in cols and 'MA20' in cols:
+        ma5 = df['MA5'].to_numpy(np.float64)
+        ma20 = df['MA20'].to_numpy(np.float64)
+        diff = ma5 - ma20
+        prev = _shift1(diff)
+        idx = np.select(
+            [(diff > 0) & (prev <= 0),
+             (diff < 0) & (prev >= 0),
+             (close > ma5) & (ma5 > ma20),
+             (close < ma5) & (ma5 < ma20)],
+            [0, 1, 2, 3], default=4)
+        signals['均线'] = MA_LABELS[idx[-1]]
+
     # MACD分析
-    if 'DIF' in df.columns and 'DEA' in df.columns:
-        if latest['DIF'] > latest['DEA'] and prev['DIF'] <= prev['DEA']:
-            signals['MACD'] = '🟢 金叉'
-        elif latest['DIF'] < latest['DEA'] and prev['DIF'] >= prev['DEA']:
-            signals['MACD'] = '🔴 死叉'
-        elif latest['MACD'] > 0:
-            signals['MACD'] = '🟢 多头'
-        else:
-            signals['MACD'] = '🔴 空头'
-    
+    if 'DIF' in cols and 'DEA' in cols:
+        dif = df['DIF'].to_numpy(np.float64)
+        dea = df['DEA'].to_numpy(np.float64)
+        macd = df['MACD'].to_numpy(np.float64)
+        diff = dif - dea
+        prev = _shift1(diff)
+        idx = np.select(
+            [(diff > 0) & (prev <= 0),
+             (diff < 0) & (prev >= 0),
+             macd > 0],
+            [0, 1, 2], default=3)
+        signals['MACD'] = MACD_LABELS[idx[-1]]
+
     # RSI分析
-    if 'RSI6' in df.columns:
-        rsi = latest['RSI6']
-        if rsi > 80:
-            signals['RSI'] = f'🔴 超买 ({rsi:.1f})'
-        elif rsi < 20:
-            signals['RSI'] = f'🟢 超卖 ({rsi:.1f})'
-        elif rsi > 50:
-            signals['RSI'] = f'🟢 偏强 ({rsi:.1f})'
-        else:
-            signals['RSI'] = f'🔴 偏弱 ({rsi:.1f})'
-    
+    if 'RSI6' in cols:
+        rsi = df['RSI6'].to_numpy(np.float64)
+        idx = np.select([rsi > 80, rsi < 20, rsi > 50], [0, 1, 2], default=3)
+        signals['RSI'] = RSI_LABELS[idx[-1]].format(rsi[-1])
+
     # KDJ分析
-    if 'K' in df.columns and 'D' in df.columns:
-        if latest['K'] > latest['D'] and prev['K'] <= prev['D'] and latest['K'] < 20:
-            signals['KDJ'] = '🟢 低位金叉'
-        elif latest['K'] < latest['D'] and prev['K'] >= prev['D'] and latest['K'] > 80:
-            signals['KDJ'] = '🔴 高位死叉'
-        elif latest['J'] > 100:
-            signals['KDJ'] = f'🔴 超买 (J={latest["J"]:.1f})'
-        elif latest['J'] < 0:
-            signals['KDJ'] = f'🟢 超卖 (J={latest["J"]:.1f})'
-        else:
-            signals['KDJ'] = '⚪ 中性'
-    
+    if 'K' in cols and 'D' in cols:
+        k = df['K'].to_numpy(np.float64)
+        d = df['D'].to_numpy(np.float64)
+        j = df['J'].to_numpy(np.float64)
+        diff = k - d
+        prev = _shift1(diff)
+        idx = np.select(
+            [(diff > 0) & (prev <= 0) & (k < 20),
+             (diff < 0) & (prev >= 0) & (k > 80),
+             j > 100,
+             j < 0],
+            [0, 1, 2, 3], default=4)
+        signals['KDJ'] = KDJ_LABELS[idx[-1]].format(j[-1])
+
     # 布林带分析
-    if 'BOLL_UP' in df.columns:
-        if latest['收盘'] > latest['BOLL_UP']:
-            signals['BOLL'] = '🔴 突破上轨（注意回调）'
-        elif latest['收盘'] < latest['BOLL_DOWN']:
-            signals['BOLL'] = '🟢 突破下轨（注意反弹）'
-        else:
-            width = (latest['BOLL_UP'] - latest['BOLL_DOWN']) / latest['BOLL_MID'] * 100
-            signals['BOLL'] = f'⚪ 通道内 (带宽{width:.1f}%)'
-    
+    if 'BOLL_UP' in cols:
+        up = df['BOLL_UP'].to_numpy(np.float64)
+        down = df['BOLL_DOWN'].to_numpy(np.float64)
+        mid = df['BOLL_MID'].to_numpy(np.float64)
+        idx = np.select([close > up, close < down], [0, 1], default=2)
+        width = (up[-1] - down[-1]) / mid[-1] * 100
+        signals['BOLL'] = BOLL_LABELS[idx[-1]].format(width)
+
     return signals
 
 
+def analyze_signals(df: pd.DataFrame) -> dict:
+    """
+    分析技术信号
+
+    Returns:
+        技术信号字典
+    """
+    return classify_signals_vec(df)
+
+
+# 静态 Markdown 表头，避免每次调用重建同样的字符串
+SIGNAL_HEADER = "## 技术信号\n\n| 指标 | 信号 |\n|------|------|"
+MA_HEADER = "### 均线\n| MA5 | MA10 | MA20 | MA60 |\n|-----|------|------|------|"
+MACD_HEADER = "### MACD\n| DIF | DEA | MACD |\n|-----|-----|------|"
+RSI_HEADER = "### RSI\n| RSI6 | RSI12 | RSI24 |\n|------|-------|-------|"
+KDJ_HEADER = "### KDJ\n| K | D | J |\n|---|---|---|"
+BOLL_HEADER = "### 布林带\n| 上轨 | 中轨 | 下轨 |\n|------|------|------|"
+
+
 def format_output(df: pd.DataFrame, code: str, signals: dict) -> str:
     """格式化输出为 Markdown"""
     lines = [f"# {code} 技术分析\n"]
-    
-    latest = df.iloc[-1]
-    
+
+    # 最后一行一次性转为纯 dict (NaN 置 None)，避免逐格走 pandas __getitem__
+    row = {k: (v if pd.notna(v) else None) for k, v in df.iloc[-1].to_dict().items()}
+
+    def _f(key, spec='.2f', default='N/A'):
+        v = row.get(key)
+        return format(v, spec) if v is not None else default
+
+    def _row(keys, spec='.2f'):
+        return f"| {' | '.join(_f(k, spec) for k in keys)} |"
+
     # 信号汇总
-    lines.append("## 技术信号\n")
-    lines.append("| 指标 | 信号 |")
-    lines.append("|------|------|")
+    lines.append(SIGNAL_HEADER)
     for name, signal in signals.items():
         lines.append(f"| {name} | {signal} |")
     lines.append("")
-    
+
     # 指标数值
     lines.append("## 指标数值\n")
-    lines.append("### 均线")
-    lines.append("| MA5 | MA10 | MA20 | MA60 |")
-    lines.append("|-----|------|------|------|")
-    ma_vals = [f"{latest.get(f'MA{p}', 'N/A'):.2f}" if pd.notna(latest.get(f'MA{p}')) else 'N/A' for p in [5,10,20,60]]
-    lines.append(f"| {' | '.join(ma_vals)} |")
+    lines.append(MA_HEADER)
+    lines.append(_row([f'MA{p}' for p in (5, 10, 20, 60)]))
     lines.append("")
-    
-    lines.append("### MACD")
-    lines.append("| DIF | DEA | MACD |")
-    lines.append("|-----|-----|------|")
-    dif = f"{latest.get('DIF', 0):.3f}" if pd.notna(latest.get('DIF')) else 'N/A'
-    dea = f"{latest.get('DEA', 0):.3f}" if pd.notna(latest.get('DEA')) else 'N/A'
-    macd = f"{latest.get('MACD', 0):.3f}" if pd.notna(latest.get('MACD')) else 'N/A'
-    lines.append(f"| {dif} | {dea} | {macd} |")
+
+    lines.append(MACD_HEADER)
+    lines.append(_row(['DIF', 'DEA', 'MACD'], '.3f'))
     lines.append("")
-    
-    lines.append("### RSI")
-    lines.append("| RSI6 | RSI12 | RSI24 |")
-    lines.append("|------|-------|-------|")
-    rsi_vals = [f"{latest.get(f'RSI{p}', 'N/A'):.2f}" if pd.notna(latest.get(f'RSI{p}')) else 'N/A' for p in [6,12,24]]
-    lines.append(f"| {' | '.join(rsi_vals)} |")
+
+    lines.append(RSI_HEADER)
+    lines.append(_row([f'RSI{p}' for p in (6, 12, 24)]))
     lines.append("")
-    
-    lines.append("### KDJ")
-    lines.append("| K | D | J |")
-    lines.append("|---|---|---|")
-    kdj_vals = [f"{latest.get(k, 'N/A'):.2f}" if pd.notna(latest.get(k)) else 'N/A' for k in ['K','D','J']]
-    lines.append(f"| {' | '.join(kdj_vals)} |")
+
+    lines.append(KDJ_HEADER)
+    lines.append(_row(['K', 'D', 'J']))
     lines.append("")
-    
-    lines.append("### 布林带")
-    lines.append("| 上轨 | 中轨 | 下轨 |")
-    lines.append("|------|------|------|")
-    boll_vals = [f"{latest.get(k, 'N/A'):.2f}" if pd.notna(latest.get(k)) else 'N/A' for k in ['BOLL_UP','BOLL_MID','BOLL_DOWN']]
-    lines.append(f"| {' | '.join(boll_vals)} |")
-    
+
+    lines.append(BOLL_HEADER)
+    lines.append(_row(['BOLL_UP', 'BOLL_MID', 'BOLL_DOWN']))
+
     return "\n".join(lines)
 
 
@@ -294,31 +471,42 @@ def main():
     end_date = datetime.now().strftime('%Y%m%d')
     start_date = (datetime.now() - timedelta(days=args.days)).strftime('%Y%m%d')
     
-    df = ak.stock_zh_a_hist(
-        symbol=args.code,
-        period='daily',
-        start_date=start_date,
-        end_date=end_date,
-        adjust='qfq'
-    )
+    # 仅对 akshare 调用静音，保留本地代码的告警
+    # (如 pandas 的 DataFrame 碎片化 PerformanceWarning)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        df = ak.stock_zh_a_hist(
+            symbol=args.code,
+            period='daily',
+            start_date=start_date,
+            end_date=end_date,
+            adjust='qfq'
+        )
     
     if df is None or df.empty:
         print("无法获取数据")
         return
-    
+
+    # 只保留指标计算需要的列并统一为 float64，
+    # 后续 to_numpy() 零拷贝进入各计算核，无 object dtype 参与
+    df = df[['日期', '开盘', '收盘', '最高', '最低', '成交量']].copy()
+    for c in ('开盘', '收盘', '最高', '最低', '成交量'):
+        df[c] = df[c].astype(np.float64, copy=False)
+
     # 计算所有指标
     df = calc_all_indicators(df)
     
     # 分析信号
     signals = analyze_signals(df)
     
-    # 格式化输出
+    # 格式化输出: 一次性写二进制缓冲，避免终端逐行 flush
     output = format_output(df, args.code, signals)
-    print(output)
-    
+    sys.stdout.buffer.write(output.encode('utf-8'))
+    sys.stdout.buffer.write(b'\n')
+
     if args.output:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(output)
+        with open(args.output, 'wb', buffering=1 << 16) as f:
+            f.write(output.encode('utf-8'))
         print(f"\n已保存至: {args.output}")
 
 
@@ -8,7 +8,6 @@
 import argparse
 import sys
 import warnings
-warnings.filterwarnings('ignore')
 
 try:
     import akshare as ak
@@ -17,7 +16,7 @@ except ImportError:
     print("请先安装依赖: pip install akshare pandas")
     sys.exit(1)
 
-from cache_manager import cache_get, cache_set
+from cache_manager import cache_get_df, cache_set_df
 
 
 def get_dividend(code: str, use_cache: bool = True):
@@ -25,26 +24,31 @@ def get_dividend(code: str, use_cache: bool = True):
     print(f"获取分红记录: {code}")
     
     if use_cache:
-        cached_data = cache_get('dividend', code)
-        if cached_data:
+        cached_df = cache_get_df('dividend', code)
+        if cached_df is not None:
             print("从缓存加载数据...")
-            print(pd.DataFrame(cached_data).head(10).to_string(index=False))
-            return
+            print(cached_df.head(10).to_csv(sep='\t', index=False))
+            return cached_df
 
     try:
-        df = ak.stock_history_dividend_detail(symbol=code, indicator="分红")
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            df = ak.stock_history_dividend_detail(symbol=code, indicator="分红")
         
         if df is not None and not df.empty:
             if use_cache:
-                cache_set('dividend', df.to_dict('records'), code)
+                cache_set_df('dividend', df, code)
                 
-            print(df.head(10).to_string(index=False))
+            print(df.head(10).to_csv(sep='\t', index=False))
+            return df
         else:
             print("未获取到分红数据")
-            
+
     except Exception as e:
         print(f"获取失败: {e}")
 
+    return None
+
 
 def main():
     parser = argparse.ArgumentParser(description='获取分红信息')
@@ -8,7 +8,6 @@
 import argparse
 import sys
 import warnings
-warnings.filterwarnings('ignore')
 
 try:
     import akshare as ak
@@ -17,7 +16,7 @@ except ImportError:
     print("请先安装依赖: pip install akshare pandas")
     sys.exit(1)
 
-from cache_manager import cache_get, cache_set
+from cache_manager import cache_get_df, cache_set_df
 
 
 def get_financial(code: str, use_cache: bool = True):
@@ -25,26 +24,32 @@ def get_financial(code: str, use_cache: bool = True):
     print(f"获取财务数据: {code}")
     
     if use_cache:
-        cached_data = cache_get('financial', code)
-        if cached_data:
+        cached_df = cache_get_df('financial', code)
+        if cached_df is not None:
             print("从缓存加载数据...")
-            display_financial(pd.DataFrame(cached_data))
-            return
+            display_financial(cached_df)
+            return cached_df
 
     try:
-        df = ak.stock_financial_abstract_ths(symbol=code, indicator="按报告期")
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            df = ak.stock_financial_abstract_ths(symbol=code, indicator="按报告期")
         
         if df is not None and not df.empty:
             display_financial(df)
             
             if use_cache:
-                cache_set('financial', df.to_dict('records'), code)
+                cache_set_df('financial', df, code)
+
+            return df
         else:
             print("未获取到数据")
-            
+
     except Exception as e:
         print(f"获取失败: {e}")
 
+    return None
+
 
 def display_financial(df: pd.DataFrame):
     """显示最新的财务数据"""
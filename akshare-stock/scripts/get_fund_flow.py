@@ -9,18 +9,20 @@
 import argparse
 import sys
 import warnings
-warnings.filterwarnings('ignore')
+from functools import lru_cache
 
 try:
     import akshare as ak
     import pandas as pd
+    import numpy as np
 except ImportError:
-    print("请先安装依赖: pip install akshare pandas")
+    print("请先安装依赖: pip install akshare pandas numpy")
     sys.exit(1)
 
-from cache_manager import cache_get, cache_set
+from cache_manager import cache_get_df, cache_set_df
 
 
+@lru_cache(maxsize=4096)
 def get_market(code: str) -> str:
     return 'sh' if code.startswith('6') else 'sz'
 
@@ -35,21 +37,22 @@ def get_fund_flow(code: str, days: int = 10, use_cache: bool = True):
     
     df = None
     if use_cache:
-        cached_data = cache_get('fund_flow', cache_key)
-        if cached_data:
+        df = cache_get_df('fund_flow', cache_key)
+        if df is not None:
             print("从缓存加载数据...")
-            df = pd.DataFrame(cached_data)
     
     if df is None:
         try:
-            df = ak.stock_individual_fund_flow(stock=code, market=market)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                df = ak.stock_individual_fund_flow(stock=code, market=market)
             if df is not None and not df.empty:
                 # 写入缓存
                 if use_cache:
-                    cache_set('fund_flow', df.to_dict('records'), cache_key, expire_seconds=3600)
+                    cache_set_df('fund_flow', df, cache_key)
         except Exception as e:
             print(f"获取失败: {e}")
-            return
+            return None
 
     if df is not None:
         print(f"\n最近 {days} 天资金流向:")
@@ -60,19 +63,25 @@ def get_fund_flow(code: str, days: int = 10, use_cache: bool = True):
         # 检查列是否存在
         show_cols = [c for c in cols if c in recent.columns]
         
-        # 格式化金额 (元 -> 万/亿)
+        # 格式化金额 (元 -> 万/亿): 两个候选字符串数组一次算好，
+        # np.where 按掩码选取，替代逐行 Python lambda
         format_df = recent[show_cols].copy()
         for col in ['主力净流入-净额', '超大单净流入-净额']:
             if col in format_df.columns:
-                format_df[col] = format_df[col].apply(lambda x: f"{x/10000:.0f}万" if abs(x) < 1e8 else f"{x/1e8:.2f}亿")
+                v = format_df[col].to_numpy(np.float64)
+                wan = np.char.add(np.char.mod('%.0f', v / 1e4), '万')
+                yi = np.char.add(np.char.mod('%.2f', v / 1e8), '亿')
+                format_df[col] = np.where(np.abs(v) < 1e8, wan, yi)
                 
         print(format_df.to_string(index=False))
         
         # 统计
-        total_in = recent['主力净流入-净额'].sum()
+        total_in = recent['主力净流入-净额'].to_numpy(np.float64).sum()
         print("-" * 50)
         print(f"{days}日主力净流入合计: {total_in/1e8:.2f} 亿元")
 
+    return df
+
 
 def main():
     parser = argparse.ArgumentParser(description='获取资金流向')
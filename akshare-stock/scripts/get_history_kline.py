@@ -11,7 +11,6 @@ import argparse
 import sys
 from datetime import datetime, timedelta
 import warnings
-warnings.filterwarnings('ignore')
 
 try:
     import akshare as ak
@@ -20,7 +19,7 @@ except ImportError:
     print("请先安装依赖: pip install akshare pandas")
     sys.exit(1)
 
-from cache_manager import cache_get, cache_set
+from cache_manager import cache_get_df, cache_set_df
 
 
 def get_history_kline(code: str, period: str = 'daily', start_date: str = None, end_date: str = None, adjust: str = 'qfq', use_cache: bool = True):
@@ -47,20 +46,26 @@ def get_history_kline(code: str, period: str = 'daily', start_date: str = None,
     cache_key = f"{code}_{period}_{start_date}_{end_date}_{adjust}"
     
     # 尝试从缓存获取
+    # 纯历史窗口 (end_date 在今天之前) 的数据不会再变化，缓存永不过期；
+    # 截止今天的窗口在 6 小时内直接复用，完全跳过网络请求
     if use_cache:
-        cached_data = cache_get('daily_kline', cache_key)
-        if cached_data:
+        today = datetime.now().strftime('%Y%m%d')
+        max_age = float('inf') if end_date < today else 6 * 3600
+        cached_df = cache_get_df('daily_kline', cache_key, max_age_seconds=max_age)
+        if cached_df is not None:
             print("从缓存加载数据...")
-            return pd.DataFrame(cached_data)
+            return cached_df
     
     try:
-        df = ak.stock_zh_a_hist(
-            symbol=code,
-            period=period,
-            start_date=start_date,
-            end_date=end_date,
-            adjust=adjust
-        )
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            df = ak.stock_zh_a_hist(
+                symbol=code,
+                period=period,
+                start_date=start_date,
+                end_date=end_date,
+                adjust=adjust
+            )
         
         if df is None or df.empty:
             print("未获取到数据")
@@ -68,9 +73,9 @@ def get_history_kline(code: str, period: str = 'daily', start_date: str = None,
             
         print(f"获取成功: {len(df)} 条记录")
         
-        # 写入缓存 (转换为 dict 列表)
+        # 写入缓存 (Parquet)
         if use_cache:
-            cache_set('daily_kline', df.to_dict('records'), cache_key)
+            cache_set_df('daily_kline', df, cache_key)
             
         return df
         
@@ -106,7 +111,7 @@ def main():
     
     if df is not None:
         print("\n数据预览 (最近10天):")
-        print(df.tail(10).to_string(index=False))
+        print(df.tail(10).to_csv(sep='\t', index=False))
 
 
 if __name__ == '__main__':
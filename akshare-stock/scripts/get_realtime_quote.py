@@ -9,7 +9,6 @@
 import argparse
 import sys
 import warnings
-warnings.filterwarnings('ignore')
 
 try:
     import akshare as ak
@@ -18,40 +17,42 @@ except ImportError:
     print("请先安装依赖: pip install akshare pandas")
     sys.exit(1)
 
-from cache_manager import cache_get, cache_set
+from cache_manager import cache_get_df, cache_set_df
 
 
 def get_realtime_quote(codes: list, Use_markdown: bool = True, use_cache: bool = True):
     """获取实时行情"""
     print("正在获取实时行情...")
     
-    # 尝试从缓存获取 (全量市场数据)
+    # 尝试从缓存获取 (全量市场数据, Parquet 列存，免去逐行 dict 重建)
     df = None
     if use_cache:
-        cached_data = cache_get('realtime', 'market_spot')
-        if cached_data:
-            # print("从缓存加载市场数据...")
-            df = pd.DataFrame(cached_data)
+        df = cache_get_df('realtime', 'market_spot')
     
     if df is None:
         try:
-            df = ak.stock_zh_a_spot_em()
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                df = ak.stock_zh_a_spot_em()
             # 写入缓存
             if use_cache:
-                cache_set('realtime', df.to_dict('records'), 'market_spot')
+                cache_set_df('realtime', df, 'market_spot')
         except Exception as e:
             print(f"获取失败: {e}")
-            return
+            return None
     
-    if df is not None:
-        result = df[df['代码'].isin(codes)]
-        if len(result) > 0:
-            if Use_markdown:
-                print(result.to_markdown(index=False))
-            else:
-                print(result.to_string(index=False))
+    # 以 '代码' 建哈希索引后按键取行，替代对 ~5000 行的 isin 线性扫描
+    indexed = df.set_index('代码', drop=False)
+    found = [c for c in codes if c in indexed.index]
+    result = indexed.loc[found].reset_index(drop=True)
+    if len(result) > 0:
+        if Use_markdown:
+            print(result.to_markdown(index=False))
         else:
-            print(f"未找到代码: {codes}")
+            print(result.to_string(index=False))
+    else:
+        print(f"未找到代码: {codes}")
+    return result
 
 
 def main():
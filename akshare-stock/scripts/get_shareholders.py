@@ -8,7 +8,6 @@
 import argparse
 import sys
 import warnings
-warnings.filterwarnings('ignore')
 
 try:
     import akshare as ak
@@ -17,7 +16,7 @@ except ImportError:
     print("请先安装依赖: pip install akshare pandas")
     sys.exit(1)
 
-from cache_manager import cache_get, cache_set
+from cache_manager import cache_get_df, cache_set_df
 
 
 def get_shareholders(code: str, use_cache: bool = True):
@@ -25,26 +24,31 @@ def get_shareholders(code: str, use_cache: bool = True):
     print(f"获取股东信息: {code}")
     
     if use_cache:
-        cached_data = cache_get('shareholders', code)
-        if cached_data:
+        cached_df = cache_get_df('shareholders', code)
+        if cached_df is not None:
             print("从缓存加载数据...")
-            display_holders(pd.DataFrame(cached_data))
-            return
+            display_holders(cached_df)
+            return cached_df
 
     try:
-        df = ak.stock_main_stock_holder(stock=code)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            df = ak.stock_main_stock_holder(stock=code)
         
         if df is not None and not df.empty:
             if use_cache:
-                cache_set('shareholders', df.to_dict('records'), code)
+                cache_set_df('shareholders', df, code)
                 
             display_holders(df)
+            return df
         else:
             print("未获取到数据")
-            
+
     except Exception as e:
         print(f"获取失败: {e}")
 
+    return None
+
 
 def display_holders(df: pd.DataFrame):
     """显示股东信息"""
@@ -64,7 +68,7 @@ def display_holders(df: pd.DataFrame):
         latest = latest.rename(columns=col_map)
         
         show_cols = [c for c in cols if c in latest.columns]
-        print(latest[show_cols].to_string(index=False))
+        print(latest[show_cols].to_csv(sep='\t', index=False))
 
 
 def main():
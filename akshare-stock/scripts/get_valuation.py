@@ -8,7 +8,6 @@
 import argparse
 import sys
 import warnings
-warnings.filterwarnings('ignore')
 
 try:
     import akshare as ak
@@ -39,14 +38,16 @@ def get_valuation(code: str, use_cache: bool = True):
         if cached_data:
             print("从缓存加载数据...")
             display_valuation(cached_data)
-            return
+            return cached_data
 
     try:
-        df = ak.stock_individual_spot_xq(symbol=symbol)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            df = ak.stock_individual_spot_xq(symbol=symbol)
         
         if df is not None:
-            # 转换为 dict 列表
-            data = dict(zip(df['item'], df['value']))
+            # 经 ndarray 构建 dict，绕过 Series.__iter__ 的逐元素装箱
+            data = dict(zip(df['item'].to_numpy(), df['value'].to_numpy()))
             
             # 显示
             display_valuation(data)
@@ -54,27 +55,35 @@ def get_valuation(code: str, use_cache: bool = True):
             # 写入缓存
             if use_cache:
                 cache_set('valuation', data, symbol)
-                
+
+            return data
+
     except Exception as e:
         print(f"获取失败: {e}")
 
+    return None
+
 
 def display_valuation(data: dict):
     """显示估值信息"""
-    print("-" * 30)
-    print(f"股票名称: {data.get('名称', '')}")
-    print(f"当前价格: {data.get('现价', '')}")
-    print(f"涨跌幅:   {data.get('涨幅', '')}%")
-    print("-" * 30)
-    print(f"市盈率(动):  {data.get('市盈率(动)', '')}")
-    print(f"市盈率(静):  {data.get('市盈率(静)', '')}")
-    print(f"市盈率(TTM): {data.get('市盈率(TTM)', '')}")
-    print(f"市净率:      {data.get('市净率', '')}")
-    print("-" * 30)
-    print(f"股息率(TTM): {data.get('股息率(TTM)', '')}%")
-    print(f"每股收益:    {data.get('每股收益', '')}")
-    print(f"每股净资产:  {data.get('每股净资产', '')}")
-    print("-" * 30)
+    sep = "-" * 30
+    lines = [
+        sep,
+        f"股票名称: {data.get('名称', '')}",
+        f"当前价格: {data.get('现价', '')}",
+        f"涨跌幅:   {data.get('涨幅', '')}%",
+        sep,
+        f"市盈率(动):  {data.get('市盈率(动)', '')}",
+        f"市盈率(静):  {data.get('市盈率(静)', '')}",
+        f"市盈率(TTM): {data.get('市盈率(TTM)', '')}",
+        f"市净率:      {data.get('市净率', '')}",
+        sep,
+        f"股息率(TTM): {data.get('股息率(TTM)', '')}%",
+        f"每股收益:    {data.get('每股收益', '')}",
+        f"每股净资产:  {data.get('每股净资产', '')}",
+        sep,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -14,8 +14,11 @@
 """
 import argparse
 import os
+import sched
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
@@ -31,6 +34,18 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 SKILL_DIR = os.path.dirname(SCRIPT_DIR)
 CONFIG_PATH = os.path.join(SKILL_DIR, 'config.yaml')
 
+# 本地抓取/分析模块在模块级导入一次，避免每只股票重复走导入查找
+try:
+    from get_realtime_quote import get_realtime_quote
+    from get_history_kline import get_history_kline
+    from get_valuation import get_valuation
+    from get_fund_flow import get_fund_flow
+    from analyze_investment import InvestmentAnalyzer, get_code_with_prefix
+    from cache_manager import get_cache
+except ImportError as e:
+    print(f"依赖模块加载失败: {e}")
+    raise
+
 
 def load_config() -> dict:
     """加载配置文件"""
@@ -62,13 +77,24 @@ def get_default_config() -> dict:
     }
 
 
+class RateLimiter:
+    """最小间隔限速器: 并发抓取时约束对 akshare 接口的请求节奏"""
+
+    def __init__(self, min_interval: float = 0.2):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._last = 0.0
+
+    def wait(self):
+        with self._lock:
+            delay = self._last + self.min_interval - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            self._last = time.time()
+
+
 def fetch_stock_data(code: str):
     """获取单只股票数据"""
-    from get_realtime_quote import get_realtime_quote
-    from get_history_kline import get_history_kline
-    from get_valuation import get_valuation
-    from get_fund_flow import get_fund_flow
-    
     print(f"正在获取 {code} 数据...")
     
     try:
@@ -98,44 +124,76 @@ def fetch_stock_data(code: str):
 
 def generate_report(config: dict):
     """生成分析报告"""
-    from analyze_investment import InvestmentAnalyzer
-    
     report_dir = config.get('output', {}).get('report_dir', './reports')
-    
+
     # 确保报告目录存在
     os.makedirs(report_dir, exist_ok=True)
-    
+
     watchlist = config.get('watchlist', [])
+
+    # 时间戳整个批次取一次，报告头与所有文件名共用
+    now = datetime.now()
+    today = now.strftime('%Y%m%d')
+
+    # 全市场快照整个批次只拉一次，建索引后注入每个分析器，
+    # 避免每只股票重复下载 ~5000 行并线性扫描
+    spot_df = None
+    try:
+        import akshare as ak
+        spot_df = ak.stock_zh_a_spot_em().set_index('代码', drop=False)
+    except Exception as e:
+        print(f"获取市场快照失败: {e}")
     
-    all_reports = ["# 股票分析报告汇总\n"]
-    all_reports.append(f"**生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
-    all_reports.append("---\n")
-    
-    for stock in watchlist:
+    # 预热: 一条批量查询把整个观察列表的估值缓存拉进进程内一级缓存，
+    # 并发分析阶段的逐键 cache_get 变成 dict 命中而非 N 次 SQLite 查询
+    try:
+        cache = get_cache()
+        cache.get_many([cache._generate_key('valuation', get_code_with_prefix(st['code']))
+                        for st in watchlist])
+    except Exception as e:
+        print(f"缓存预热失败: {e}")
+
+    def _analyze(stock):
         code = stock['code']
         name = stock.get('name', code)
         print(f"正在分析 {name} ({code})...")
-        
         try:
-            analyzer = InvestmentAnalyzer(code)
-            report = analyzer.generate_report()
-            
-            # 保存单只股票报告
-            filename = f"{code}_{datetime.now().strftime('%Y%m%d')}.md"
-            filepath = os.path.join(report_dir, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(report)
-            print(f"  ✓ 已保存: {filepath}")
-            
-            all_reports.append(report)
-            all_reports.append("\n---\n")
+            analyzer = InvestmentAnalyzer(code, spot_df=spot_df)
+            return code, analyzer.generate_report()
         except Exception as e:
-            print(f"  ✗ 分析失败: {e}")
-    
-    # 保存汇总报告
-    summary_file = os.path.join(report_dir, f"summary_{datetime.now().strftime('%Y%m%d')}.md")
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(all_reports))
+            print(f"  ✗ {name} 分析失败: {e}")
+            return code, None
+
+    # 分析阶段以网络 IO 为主，用线程池并发；文件写入留在主线程串行完成
+    concurrency = config.get('scheduler', {}).get('concurrency', 8)
+    with ThreadPoolExecutor(max_workers=concurrency) as ex:
+        results = list(ex.map(_analyze, watchlist))
+
+    # 默认只写汇总文件; 单只股票文件按 output.per_stock 开启，
+    # 避免同样的字节落盘两遍
+    per_stock = config.get('output', {}).get('per_stock', False)
+
+    # 汇总文件只打开一次，大缓冲顺序追加，不再先在内存攒整份字符串
+    summary_file = os.path.join(report_dir, f"summary_{today}.md")
+    with open(summary_file, 'w', buffering=1 << 20, encoding='utf-8') as f:
+        f.write("# 股票分析报告汇总\n\n")
+        f.write(f"**生成时间**: {now.strftime('%Y-%m-%d %H:%M')}\n\n")
+        f.write("---\n")
+
+        for code, report in results:
+            if report is None:
+                continue
+
+            if per_stock:
+                filepath = os.path.join(report_dir, f"{code}_{today}.md")
+                with open(filepath, 'w', encoding='utf-8') as pf:
+                    pf.write(report)
+                print(f"  ✓ 已保存: {filepath}")
+
+            f.write('\n')
+            f.write(report)
+            f.write('\n\n---\n')
+
     print(f"\n汇总报告已保存: {summary_file}")
 
 
@@ -146,12 +204,18 @@ def run_daily_task(config: dict):
     print(f"{'='*50}\n")
     
     watchlist = config.get('watchlist', [])
-    
-    # 获取数据
-    for stock in watchlist:
+
+    # 获取数据: 网络延迟为主，线程池并发 + 限速器替代逐只 sleep(1)
+    limiter = RateLimiter()
+
+    def _fetch(stock):
+        limiter.wait()
         fetch_stock_data(stock['code'])
-        time.sleep(1)  # 避免请求过快
-    
+
+    concurrency = config.get('scheduler', {}).get('concurrency', 8)
+    with ThreadPoolExecutor(max_workers=concurrency) as ex:
+        list(ex.map(_fetch, watchlist))
+
     # 生成报告
     generate_report(config)
     
@@ -165,36 +229,36 @@ def run_scheduler(config: dict):
         return
     
     daily_time = config.get('scheduler', {}).get('daily_fetch_time', '15:30')
+    hour, minute = (int(x) for x in daily_time.split(':'))
     
     print(f"定时任务调度器已启动")
     print(f"每日执行时间: {daily_time}")
     print(f"监控股票: {len(config.get('watchlist', []))} 只")
     print(f"按 Ctrl+C 停止\n")
-    
-    while True:
+
+    # sched 按绝对时间戳调度: 每轮结束后重新计算下一个目标点，
+    # 任务耗时或时钟调整不会像固定 sleep 那样累积漂移
+    timer = sched.scheduler(time.time, time.sleep)
+
+    def _next_run_ts() -> float:
         now = datetime.now()
-        target_time = now.replace(
-            hour=int(daily_time.split(':')[0]),
-            minute=int(daily_time.split(':')[1]),
-            second=0,
-            microsecond=0
-        )
-        
+        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
         # 如果今天的时间已过，等到明天
-        if now > target_time:
-            target_time += timedelta(days=1)
-        
-        wait_seconds = (target_time - now).total_seconds()
-        
-        print(f"下次执行时间: {target_time.strftime('%Y-%m-%d %H:%M')}")
-        print(f"等待 {wait_seconds/3600:.1f} 小时...")
-        
-        try:
-            time.sleep(wait_seconds)
-            run_daily_task(config)
-        except KeyboardInterrupt:
-            print("\n调度器已停止")
-            break
+        if now >= target:
+            target += timedelta(days=1)
+        print(f"下次执行时间: {target.strftime('%Y-%m-%d %H:%M')}")
+        print(f"等待 {(target - now).total_seconds()/3600:.1f} 小时...")
+        return target.timestamp()
+
+    def _tick():
+        run_daily_task(config)
+        timer.enterabs(_next_run_ts(), 1, _tick)
+
+    timer.enterabs(_next_run_ts(), 1, _tick)
+    try:
+        timer.run()
+    except KeyboardInterrupt:
+        print("\n调度器已停止")
 
 
 def main():
@@ -10,25 +10,76 @@ AKShare 个股综合分析脚本
     python stock_analyzer.py 600519 --output 茅台分析.txt
 """
 import argparse
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 import warnings
 
 warnings.filterwarnings('ignore')
 
+# akshare/pandas 的导入推迟到 main() 参数解析之后 (_load_dependencies):
+# --help 与参数错误路径不再付出 1-2 秒的重依赖导入
+ak = None
+pd = None
+HAS_PYARROW = False
+
+# requests_cache 为可选加速: 给 akshare 底层的 requests 会话挂一层
+# 磁盘 TTL 缓存。模式按真实请求 URL 匹配: 默认 TTL 取 10 秒兜底，
+# 行情类接口 (东财 push2 盘口/基本信息共用同一端点、雪球快照) 不会被
+# 长缓存污染; 仅准静态端点按 URL 片段放宽到小时/天级
 try:
-    import akshare as ak
-    import pandas as pd
+    import requests_cache
+    requests_cache.install_cache(
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                     '.cache', 'ak_http'),
+        backend='sqlite',
+        expire_after=10,
+        urls_expire_after={
+            # K线 / 资金流 (东财历史数据端点)
+            '*push2his.eastmoney.com/api/qt/stock/kline*': 43200,
+            '*push2his.eastmoney.com/api/qt/stock/fflow*': 3600,
+            # 股东 / 分红 (新浪财经)
+            '*vip.stock.finance.sina.com.cn*': 86400,
+            # 财务摘要 (同花顺)
+            '*basic.10jqka.com.cn*': 86400,
+        },
+    )
 except ImportError:
-    print("请先安装依赖: pip install akshare pandas")
-    sys.exit(1)
+    pass
+
+def _load_dependencies():
+    """导入重依赖并配置 pandas 显示选项（参数校验通过后调用）"""
+    global ak, pd, HAS_PYARROW
+    try:
+        import akshare
+        import pandas
+    except ImportError:
+        print("请先安装依赖: pip install akshare pandas")
+        sys.exit(1)
+    ak = akshare
+    pd = pandas
+
+    # pyarrow 为可选加速 (见 _to_arrow)
+    try:
+        import pyarrow  # noqa: F401
+        HAS_PYARROW = True
+    except ImportError:
+        HAS_PYARROW = False
 
-# 配置 pandas 显示选项
-pd.set_option('display.max_columns', None)
-pd.set_option('display.width', 200)
-pd.set_option('display.max_rows', 50)
+    # 配置 pandas 显示选项
+    pd.set_option('display.max_columns', None)
+    pd.set_option('display.width', 200)
+    pd.set_option('display.max_rows', 50)
 
 
+# 首字符 -> 交易所/市场映射表: 单次 dict 查询替代逐个 startswith
+PREFIX_MAP = {'6': 'SH', '0': 'SZ', '3': 'SZ', '4': 'BJ', '8': 'BJ'}  # 4/8 北交所
+MARKET_MAP = {'6': 'sh'}
+
+
+@lru_cache(maxsize=4096)
 def get_stock_code_with_prefix(code: str) -> str:
     """
     将纯数字股票代码转换为带交易所前缀的格式
@@ -40,16 +91,10 @@ def get_stock_code_with_prefix(code: str) -> str:
         带前缀的代码，如 "SZ002475"
     """
     code = code.strip()
-    if code.startswith('6'):
-        return f"SH{code}"
-    elif code.startswith(('0', '3')):
-        return f"SZ{code}"
-    elif code.startswith(('4', '8')):
-        return f"BJ{code}"  # 北交所
-    else:
-        return f"SZ{code}"
+    return f"{PREFIX_MAP.get(code[:1], 'SZ')}{code}"
 
 
+@lru_cache(maxsize=4096)
 def get_market(code: str) -> str:
     """
     根据代码获取市场标识
@@ -60,226 +105,296 @@ def get_market(code: str) -> str:
     Returns:
         市场标识 "sh" 或 "sz"
     """
-    if code.startswith('6'):
-        return 'sh'
-    else:
-        return 'sz'
+    return MARKET_MAP.get(code[:1], 'sz')
+
+
+class Logger:
+    """按行分发到多个输出端的日志器 (终端 + 可选文件)"""
+
+    def __init__(self, *sinks):
+        self._sinks = sinks
 
+    def __call__(self, msg: str):
+        line = msg + '\n'
+        for sink in self._sinks:
+            sink(line)
 
-def analyze_stock(code: str, output_file: str = None):
+
+# 第 4/8 节的展示字段表: 由生成式一次产出所有行，增删字段只改这里
+XQ_FIELDS = (
+    ('市盈率(动态)', '市盈率(动)', ''),
+    ('市盈率(静态)', '市盈率(静)', ''),
+    ('市盈率(TTM)', '市盈率(TTM)', ''),
+    ('市净率(PB)', '市净率', ''),
+    ('每股收益', '每股收益', ''),
+    ('每股净资产', '每股净资产', ''),
+    ('股息率(TTM)', '股息率(TTM)', '%'),
+    ('52周最高', '52周最高', ''),
+    ('52周最低', '52周最低', ''),
+    ('今年以来涨幅', '今年以来涨幅', '%'),
+)
+
+# 表格展示只取关心的列: pandas 文本格式化开销随单元格数线性增长
+HIST_COLS = ['日期', '开盘', '收盘', '最高', '最低', '成交量', '成交额', '换手率']
+FLOW_COLS = ['日期', '收盘价', '涨跌幅', '主力净流入-净额', '主力净流入-净占比', '超大单净流入-净额']
+
+FINA_FIELDS = (
+    '报告期', '净利润', '净利润同比增长率', '扣非净利润',
+    '营业总收入', '营业总收入同比增长率', '基本每股收益', '每股净资产',
+    '每股经营现金流', '销售净利率', '销售毛利率', '净资产收益率', '资产负债率',
+)
+
+
+def _to_arrow(df):
+    """pyarrow 可用时转为 Arrow 列存: 字符串列连续存储，聚合走 C++ 内核"""
+    if df is not None and HAS_PYARROW:
+        try:
+            return df.convert_dtypes(dtype_backend='pyarrow')
+        except Exception:
+            return df
+    return df
+
+
+def _submit_tasks(executor, code: str, now: datetime) -> dict:
+    """
+    提交单只股票的全部数据请求
+
+    Args:
+        executor: 线程池
+        code: 股票代码（6位数字）
+        now: 本批次的时间基准（决定 K 线日期窗口）
+
+    Returns:
+        {数据名: Future} 任务字典
+    """
+    code_with_prefix = get_stock_code_with_prefix(code)
+    market = get_market(code)
+    end_date = now.strftime('%Y%m%d')
+    start_date = (now - timedelta(days=60)).strftime('%Y%m%d')
+    return {
+        'info': executor.submit(ak.stock_individual_info_em, symbol=code),
+        'spot': executor.submit(ak.stock_bid_ask_em, symbol=code),
+        'hist': executor.submit(ak.stock_zh_a_hist, symbol=code, period="daily",
+                                start_date=start_date, end_date=end_date, adjust="qfq"),
+        'xq': executor.submit(ak.stock_individual_spot_xq, symbol=code_with_prefix),
+        'flow': executor.submit(ak.stock_individual_fund_flow, stock=code, market=market),
+        'holders': executor.submit(ak.stock_main_stock_holder, stock=code),
+        'div': executor.submit(ak.stock_history_dividend_detail, symbol=code, indicator="分红"),
+        'fina': executor.submit(ak.stock_financial_abstract_ths, symbol=code, indicator="按报告期"),
+    }
+
+
+def analyze_stock(code: str, output_file: str = None, executor=None, tasks: dict = None):
     """
     综合分析单只股票
 
     Args:
         code: 股票代码（6位数字）
         output_file: 可选，输出文件路径
+        executor: 可选，批量模式注入的共享线程池
+        tasks: 可选，已经提交的任务字典（批量模式下预取下一只时传入）
     """
-    results = []
+    code = code.strip()
 
-    def log(msg: str):
-        """记录输出"""
-        print(msg)
-        results.append(msg)
+    # 输出逐行流向各端，不再整份攒在内存里到结尾 join:
+    # 峰值内存与报告长度解耦，文件端走 64KB 缓冲顺序追加
+    out_f = open(output_file, 'w', encoding='utf-8', buffering=65536) if output_file else None
+    log = Logger(sys.stdout.write, out_f.write) if out_f is not None else Logger(sys.stdout.write)
 
-    code = code.strip()
-    code_with_prefix = get_stock_code_with_prefix(code)
-    market = get_market(code)
+    # 时间取一次: 报告头与 K 线日期窗口共用，避免跨午夜时边界错位
+    now = datetime.now()
 
     log("=" * 70)
     log("股票综合分析报告")
     log(f"股票代码: {code}")
-    log(f"分析时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    log(f"分析时间: {now.strftime('%Y-%m-%d %H:%M:%S')}")
     log("=" * 70)
 
-    # 1. 基本信息
-    log("\n【1. 基本信息】")
-    log("-" * 50)
-    try:
-        info = ak.stock_individual_info_em(symbol=code)
-        if info is not None and len(info) > 0:
-            for _, row in info.iterrows():
-                log(f"{row['item']}: {row['value']}")
-        else:
-            log("无法获取基本信息")
-    except Exception as e:
-        log(f"获取基本信息失败: {e}")
-
-    # 2. 实时行情
-    log("\n【2. 实时行情】")
-    log("-" * 50)
+    # 八个数据源互相独立且以网络 IO 为主: 先全部并发提交，
+    # 再按固定版面顺序取结果，等待时间由八次请求之和降为最慢一次。
+    # 批量模式会注入共享线程池并提前提交好 tasks，单只模式自建自收
+    own_executor = ThreadPoolExecutor(max_workers=8) if executor is None else None
     try:
-        spot = ak.stock_zh_a_spot_em()
-        stock_row = spot[spot['代码'] == code]
-        if len(stock_row) > 0:
-            row = stock_row.iloc[0]
-            log(f"股票名称: {row['名称']}")
-            log(f"最新价: {row['最新价']}")
-            log(f"涨跌幅: {row['涨跌幅']}%")
-            log(f"涨跌额: {row['涨跌额']}")
-            log(f"成交量: {row['成交量']}手")
-            log(f"成交额: {row['成交额'] / 1e8:.2f}亿")
-            log(f"振幅: {row['振幅']}%")
-            log(f"最高: {row['最高']}")
-            log(f"最低: {row['最低']}")
-            log(f"今开: {row['今开']}")
-            log(f"昨收: {row['昨收']}")
-            log(f"换手率: {row['换手率']}%")
-            log(f"量比: {row['量比']}")
-            log(f"市盈率(动态): {row['市盈率-动态']}")
-            log(f"市净率: {row['市净率']}")
-            log(f"总市值: {row['总市值'] / 1e8:.2f}亿")
-            log(f"流通市值: {row['流通市值'] / 1e8:.2f}亿")
-            log(f"60日涨跌幅: {row['60日涨跌幅']}%")
-            log(f"年初至今涨跌幅: {row['年初至今涨跌幅']}%")
-        else:
-            log(f"未找到股票 {code}")
-    except Exception as e:
-        log(f"获取实时行情失败: {e}")
-
-    # 3. 近期K线走势
-    log("\n【3. 近期K线走势（最近30个交易日）】")
-    log("-" * 50)
-    try:
-        end_date = datetime.now().strftime('%Y%m%d')
-        start_date = (datetime.now() - timedelta(days=60)).strftime('%Y%m%d')
-        hist = ak.stock_zh_a_hist(
-            symbol=code,
-            period="daily",
-            start_date=start_date,
-            end_date=end_date,
-            adjust="qfq"
-        )
-        if hist is not None and len(hist) > 0:
-            log(hist.tail(30).to_string(index=False))
-
-            # 统计摘要
-            recent = hist.tail(30)
-            log("\n--- 近30日统计 ---")
-            log(f"最新收盘价: {recent['收盘'].iloc[-1]:.2f}")
-            log(f"期间最高价: {recent['最高'].max():.2f}")
-            log(f"期间最低价: {recent['最低'].min():.2f}")
-            if len(recent) > 1:
-                change = ((recent['收盘'].iloc[-1] / recent['收盘'].iloc[0]) - 1) * 100
+        if tasks is None:
+            tasks = _submit_tasks(own_executor or executor, code, now)
+
+        # 1. 基本信息
+        log("\n【1. 基本信息】")
+        log("-" * 50)
+        try:
+            info = tasks['info'].result(timeout=30)
+            if info is not None and len(info) > 0:
+                # 列级字符串拼接一次成串，免去 iterrows 逐行装箱
+                log('\n'.join((info['item'].astype(str) + ': ' + info['value'].astype(str)).tolist()))
+            else:
+                log("无法获取基本信息")
+        except Exception as e:
+            log(f"获取基本信息失败: {e}")
+
+        # 2. 实时行情
+        log("\n【2. 实时行情】")
+        log("-" * 50)
+        try:
+            # 单票盘口接口只有几十个字段，替代全市场快照 (~5000 行)
+            # 的下载与逐行过滤
+            bid = tasks['spot'].result(timeout=30)
+            if bid is not None and len(bid) > 0:
+                # zip 底层 ndarray 建字典，跳过 Series 逐元素装箱迭代
+                row = dict(zip(bid['item'].to_numpy(), bid['value'].to_numpy()))
+                # 盘口数据没有的字段从雪球结果补齐 (与第 4 节共用同一份)
+                try:
+                    xq_spot = tasks['xq'].result(timeout=30)
+                    xq_row = dict(zip(xq_spot['item'].to_numpy(), xq_spot['value'].to_numpy())) if xq_spot is not None else {}
+                except Exception:
+                    xq_row = {}
+                log(f"股票名称: {xq_row.get('名称', code)}")
+                log(f"最新价: {row.get('最新', 'N/A')}")
+                log(f"涨跌幅: {row.get('涨幅', 'N/A')}%")
+                log(f"涨跌额: {row.get('涨跌', 'N/A')}")
+                log(f"成交量: {row.get('总手', 'N/A')}手")
+                amount = row.get('金额')
+                log(f"成交额: {amount / 1e8:.2f}亿" if isinstance(amount, (int, float)) else "成交额: N/A")
+                log(f"振幅: {xq_row.get('振幅', 'N/A')}%")
+                log(f"最高: {row.get('最高', 'N/A')}")
+                log(f"最低: {row.get('最低', 'N/A')}")
+                log(f"今开: {row.get('今开', 'N/A')}")
+                log(f"昨收: {row.get('昨收', 'N/A')}")
+                log(f"换手率: {row.get('换手', 'N/A')}%")
+                log(f"量比: {row.get('量比', 'N/A')}")
+                log(f"市盈率(TTM): {xq_row.get('市盈率(TTM)', 'N/A')}")
+                log(f"市净率: {xq_row.get('市净率', 'N/A')}")
+                total_cap = xq_row.get('总市值')
+                log(f"总市值: {total_cap / 1e8:.2f}亿" if isinstance(total_cap, (int, float)) else "总市值: N/A")
+                float_cap = xq_row.get('流通值')
+                log(f"流通市值: {float_cap / 1e8:.2f}亿" if isinstance(float_cap, (int, float)) else "流通市值: N/A")
+                log(f"年初至今涨跌幅: {xq_row.get('今年以来涨幅', 'N/A')}%")
+            else:
+                log(f"未找到股票 {code}")
+        except Exception as e:
+            log(f"获取实时行情失败: {e}")
+
+        # 3. 近期K线走势
+        log("\n【3. 近期K线走势（最近30个交易日）】")
+        log("-" * 50)
+        try:
+            hist = _to_arrow(tasks['hist'].result(timeout=30))
+            if hist is not None and len(hist) > 0:
+                # 30 日切片只做一次，展示与统计共用; 五个聚合合并成单次 .agg
+                recent = hist.tail(30)
+                show_cols = [c for c in HIST_COLS if c in recent.columns]
+                log(recent[show_cols].to_string(index=False))
+
+                stats = recent.agg({'最高': 'max', '最低': 'min', '成交量': 'mean',
+                                    '成交额': 'mean', '换手率': 'mean'})
+                log("\n--- 近30日统计 ---")
+                # 收盘列取一次数组，首末两端 C 级取值; 单日窗口退化为 NaN
+                closes = recent['收盘'].to_numpy(float)
+                log(f"最新收盘价: {closes[-1]:.2f}")
+                log(f"期间最高价: {stats['最高']:.2f}")
+                log(f"期间最低价: {stats['最低']:.2f}")
+                change = (closes[-1] / closes[0] - 1) * 100 if closes.size > 1 else float('nan')
                 log(f"期间涨跌幅: {change:.2f}%")
-            log(f"日均成交量: {recent['成交量'].mean() / 10000:.2f}万手")
-            log(f"日均成交额: {recent['成交额'].mean() / 1e8:.2f}亿元")
-            log(f"日均换手率: {recent['换手率'].mean():.2f}%")
-        else:
-            log("无历史数据")
-    except Exception as e:
-        log(f"获取K线数据失败: {e}")
-
-    # 4. 估值指标 (使用雪球数据)
-    log("\n【4. 估值指标】")
-    log("-" * 50)
-    try:
-        # 使用雪球接口获取详细估值数据
-        xq_data = ak.stock_individual_spot_xq(symbol=code_with_prefix)
-        if xq_data is not None and len(xq_data) > 0:
-            # 转换为字典便于查询
-            xq_dict = dict(zip(xq_data['item'], xq_data['value']))
-            log(f"市盈率(动态): {xq_dict.get('市盈率(动)', 'N/A')}")
-            log(f"市盈率(静态): {xq_dict.get('市盈率(静)', 'N/A')}")
-            log(f"市盈率(TTM): {xq_dict.get('市盈率(TTM)', 'N/A')}")
-            log(f"市净率(PB): {xq_dict.get('市净率', 'N/A')}")
-            log(f"每股收益: {xq_dict.get('每股收益', 'N/A')}")
-            log(f"每股净资产: {xq_dict.get('每股净资产', 'N/A')}")
-            log(f"股息率(TTM): {xq_dict.get('股息率(TTM)', 'N/A')}%")
-            log(f"52周最高: {xq_dict.get('52周最高', 'N/A')}")
-            log(f"52周最低: {xq_dict.get('52周最低', 'N/A')}")
-            log(f"今年以来涨幅: {xq_dict.get('今年以来涨幅', 'N/A')}%")
-        else:
-            log("无估值数据")
-    except Exception as e:
-        log(f"获取估值指标失败: {e}")
-
-    # 5. 资金流向
-    log("\n【5. 资金流向（最近10日）】")
-    log("-" * 50)
-    try:
-        fund_flow = ak.stock_individual_fund_flow(stock=code, market=market)
-        if fund_flow is not None and len(fund_flow) > 0:
-            log(fund_flow.tail(10).to_string(index=False))
-
-            # 统计摘要
-            recent_flow = fund_flow.tail(10)
-            log("\n--- 近10日资金流统计 ---")
-            if '主力净流入-净额' in recent_flow.columns:
-                total_main = recent_flow['主力净流入-净额'].sum()
-                log(f"主力净流入合计: {total_main / 1e8:.2f}亿")
-        else:
-            log("无资金流向数据")
-    except Exception as e:
-        log(f"获取资金流向失败: {e}")
-
-    # 6. 十大股东 (使用 stock_main_stock_holder)
-    log("\n【6. 主要股东】")
-    log("-" * 50)
-    try:
-        holders = ak.stock_main_stock_holder(stock=code)
-        if holders is not None and len(holders) > 0:
-            # 获取最新一期的股东数据
-            latest_date = holders['截至日期'].max()
-            latest_holders = holders[holders['截至日期'] == latest_date]
-            log(f"截至日期: {latest_date}")
-            log(f"股东总数: {latest_holders['股东总数'].iloc[0]}")
-            log(f"平均持股数: {latest_holders['平均持股数'].iloc[0]}")
-            log("")
-            # 显示前10大股东
-            display_cols = ['编号', '股东名称', '持股数量', '持股比例', '股本性质']
-            available_cols = [c for c in display_cols if c in latest_holders.columns]
-            log(latest_holders[available_cols].head(10).to_string(index=False))
-        else:
-            log("无股东数据")
-    except Exception as e:
-        log(f"获取股东数据失败: {e}")
-
-    # 7. 历史分红
-    log("\n【7. 历史分红记录】")
-    log("-" * 50)
-    try:
-        dividend = ak.stock_history_dividend_detail(symbol=code, indicator="分红")
-        if dividend is not None and len(dividend) > 0:
-            log(dividend.head(10).to_string(index=False))
-        else:
-            log("无分红记录")
-    except Exception as e:
-        log(f"获取分红数据失败: {e}")
-
-    # 8. 财务指标 (使用同花顺接口)
-    log("\n【8. 财务指标】")
-    log("-" * 50)
-    try:
-        # 使用同花顺财务摘要接口
-        fina = ak.stock_financial_abstract_ths(symbol=code, indicator="按报告期")
-        if fina is not None and len(fina) > 0:
-            latest = fina.iloc[0]
-            log(f"报告期: {latest.get('报告期', 'N/A')}")
-            log(f"净利润: {latest.get('净利润', 'N/A')}")
-            log(f"净利润同比增长率: {latest.get('净利润同比增长率', 'N/A')}")
-            log(f"扣非净利润: {latest.get('扣非净利润', 'N/A')}")
-            log(f"营业总收入: {latest.get('营业总收入', 'N/A')}")
-            log(f"营业总收入同比增长率: {latest.get('营业总收入同比增长率', 'N/A')}")
-            log(f"基本每股收益: {latest.get('基本每股收益', 'N/A')}")
-            log(f"每股净资产: {latest.get('每股净资产', 'N/A')}")
-            log(f"每股经营现金流: {latest.get('每股经营现金流', 'N/A')}")
-            log(f"销售净利率: {latest.get('销售净利率', 'N/A')}")
-            log(f"销售毛利率: {latest.get('销售毛利率', 'N/A')}")
-            log(f"净资产收益率: {latest.get('净资产收益率', 'N/A')}")
-            log(f"资产负债率: {latest.get('资产负债率', 'N/A')}")
-        else:
-            log("无财务指标数据")
-    except Exception as e:
-        log(f"获取财务指标失败: {e}")
+                log(f"日均成交量: {stats['成交量'] / 10000:.2f}万手")
+                log(f"日均成交额: {stats['成交额'] / 1e8:.2f}亿元")
+                log(f"日均换手率: {stats['换手率']:.2f}%")
+            else:
+                log("无历史数据")
+        except Exception as e:
+            log(f"获取K线数据失败: {e}")
+
+        # 4. 估值指标 (使用雪球数据)
+        log("\n【4. 估值指标】")
+        log("-" * 50)
+        try:
+            # 使用雪球接口获取详细估值数据
+            xq_data = tasks['xq'].result(timeout=30)
+            if xq_data is not None and len(xq_data) > 0:
+                # 转换为字典便于查询
+                xq_dict = dict(zip(xq_data['item'].to_numpy(), xq_data['value'].to_numpy()))
+                log('\n'.join(f"{lbl}: {xq_dict.get(key, 'N/A')}{suf}"
+                               for lbl, key, suf in XQ_FIELDS))
+            else:
+                log("无估值数据")
+        except Exception as e:
+            log(f"获取估值指标失败: {e}")
+
+        # 5. 资金流向
+        log("\n【5. 资金流向（最近10日）】")
+        log("-" * 50)
+        try:
+            fund_flow = _to_arrow(tasks['flow'].result(timeout=30))
+            if fund_flow is not None and len(fund_flow) > 0:
+                recent_flow = fund_flow.tail(10)
+                show_cols = [c for c in FLOW_COLS if c in recent_flow.columns]
+                log(recent_flow[show_cols].to_string(index=False))
+
+                # 统计摘要
+                log("\n--- 近10日资金流统计 ---")
+                if '主力净流入-净额' in recent_flow.columns:
+                    total_main = recent_flow['主力净流入-净额'].sum()
+                    log(f"主力净流入合计: {total_main / 1e8:.2f}亿")
+            else:
+                log("无资金流向数据")
+        except Exception as e:
+            log(f"获取资金流向失败: {e}")
+
+        # 6. 十大股东 (使用 stock_main_stock_holder)
+        log("\n【6. 主要股东】")
+        log("-" * 50)
+        try:
+            holders = tasks['holders'].result(timeout=30)
+            if holders is not None and len(holders) > 0:
+                # 获取最新一期的股东数据: .loc 布尔过滤一步完成，标量用 iat 取
+                latest_date = holders['截至日期'].max()
+                latest_holders = holders.loc[holders['截至日期'] == latest_date]
+                log(f"截至日期: {latest_date}")
+                log(f"股东总数: {latest_holders['股东总数'].iat[0]}")
+                log(f"平均持股数: {latest_holders['平均持股数'].iat[0]}")
+                log("")
+                # 显示前10大股东
+                display_cols = ['编号', '股东名称', '持股数量', '持股比例', '股本性质']
+                available_cols = [c for c in display_cols if c in latest_holders.columns]
+                log(latest_holders[available_cols].head(10).to_string(index=False))
+            else:
+                log("无股东数据")
+        except Exception as e:
+            log(f"获取股东数据失败: {e}")
+
+        # 7. 历史分红
+        log("\n【7. 历史分红记录】")
+        log("-" * 50)
+        try:
+            dividend = tasks['div'].result(timeout=30)
+            if dividend is not None and len(dividend) > 0:
+                log(dividend.head(10).to_string(index=False))
+            else:
+                log("无分红记录")
+        except Exception as e:
+            log(f"获取分红数据失败: {e}")
+
+        # 8. 财务指标 (使用同花顺接口)
+        log("\n【8. 财务指标】")
+        log("-" * 50)
+        try:
+            # 使用同花顺财务摘要接口
+            fina = tasks['fina'].result(timeout=30)
+            if fina is not None and len(fina) > 0:
+                latest = fina.iloc[0]
+                log('\n'.join(f"{key}: {latest.get(key, 'N/A')}" for key in FINA_FIELDS))
+            else:
+                log("无财务指标数据")
+        except Exception as e:
+            log(f"获取财务指标失败: {e}")
+    finally:
+        if own_executor is not None:
+            own_executor.shutdown()
 
     log("\n" + "=" * 70)
     log("分析完成")
     log("=" * 70)
 
-    # 保存到文件
-    if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(results))
+    if out_f is not None:
+        out_f.close()
         print(f"\n分析报告已保存至: {output_file}")
 
 
@@ -295,12 +410,30 @@ def main():
     python stock_analyzer.py 000001 -o 平安银行分析.txt
         '''
     )
-    parser.add_argument('code', help='股票代码（6位数字），如 002475')
-    parser.add_argument('-o', '--output', help='输出文件路径（可选）')
+    parser.add_argument('codes', nargs='+', help='股票代码（6位数字），可一次传多只，如 002475 600519')
+    parser.add_argument('-o', '--output', help='输出文件路径（可选；多只股票时文件名前加代码区分）')
 
     args = parser.parse_args()
 
-    analyze_stock(args.code, args.output)
+    _load_dependencies()
+
+    codes = [c.strip() for c in args.codes]
+
+    # 批量模式: 共享线程池贯穿整个批次，渲染第 i 只之前先把第 i+1 只的
+    # 八路请求提交出去，网络往返与 pandas 格式化/输出相互重叠；
+    # akshare 的一次性导入成本也摊到所有股票上
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        now = datetime.now()
+        tasks = _submit_tasks(executor, codes[0], now)
+        for i, code in enumerate(codes):
+            next_tasks = _submit_tasks(executor, codes[i + 1], now) if i + 1 < len(codes) else None
+            output = args.output
+            if output and len(codes) > 1:
+                # 只给文件名加代码前缀，保留目录部分
+                output = os.path.join(os.path.dirname(output),
+                                      f"{code}_{os.path.basename(output)}")
+            analyze_stock(code, output, executor=executor, tasks=tasks)
+            tasks = next_tasks
 
 
 if __name__ == '__main__':
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+预热 numba 计算核
+
+calc_technical 的 @njit 核首次调用要付 0.5~2s 的 JIT 编译开销，
+会吞掉单次 `python calc_technical.py <code>` 调用的全部收益。
+所有核都带 cache=True，本脚本用小规模虚拟数据把每个核各跑一遍，
+将编译产物落盘到 __pycache__，之后的真实调用直接加载缓存。
+
+安装依赖后运行一次即可:
+    python warm_kernels.py
+"""
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("请先安装依赖: pip install numpy")
+    sys.exit(1)
+
+from calc_technical import HAS_NUMBA, _ema, _rsi_wilder, _kdj
+
+
+def warm_kernels():
+    """用虚拟数据触发所有 numba 核的编译并落盘缓存"""
+    if not HAS_NUMBA:
+        print("未安装 numba，无需预热（将使用纯 Python 实现）")
+        return
+
+    n = 32
+    close = np.cumsum(np.random.rand(n)) + 10.0
+    high = close + 0.5
+    low = close - 0.5
+    out = np.empty(n)
+
+    start = time.time()
+
+    _ema(close, 2.0 / 13, out)
+    _rsi_wilder(close, 6, out)
+    _kdj(high, low, close, 9, 3.0, 3.0, np.empty(n), np.empty(n), np.empty(n))
+
+    print(f"计算核预热完成，耗时 {time.time() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    warm_kernels()